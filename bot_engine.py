@@ -76,6 +76,18 @@ class ArbitrageBot:
         self._loop_tick = 0
         self._last_status = "initialized"
 
+        # Collaborator capabilities are fixed for the engine's lifetime;
+        # resolve the optional entry points once instead of per tick.
+        self._analyze_fn = self._first_method(
+            analyzer, "find_opportunities", "analyze_opportunities", "analyze"
+        )
+        self._approve_fn = self._first_method(risk_manager, "approve")
+        self._execute_fn = self._first_method(
+            trade_executor, "execute_and_monitor_opportunity", "execute_opportunity"
+        )
+        self._is_busy_fn = self._first_method(trade_executor, "is_busy")
+        self._request_stop_fn = self._first_method(trade_executor, "request_stop")
+
         self.log.info("SyncArbitrageEngine initialized (poll=%.2fs)", self.poll_interval_sec)
 
     # ---------------- GUI API ----------------
@@ -115,8 +127,8 @@ class ArbitrageBot:
             self._emit("on_status", "engine_stopping")
 
             try:
-                if hasattr(self.trade_executor, "request_stop"):
-                    self.trade_executor.request_stop()
+                if self._request_stop_fn:
+                    self._request_stop_fn()
             except Exception:
                 self.log.warning("TradeExecutor.request_stop failed")
 
@@ -216,12 +228,7 @@ class ArbitrageBot:
         if self.analyzer is None:
             return []
         try:
-            if hasattr(self.analyzer, "find_opportunities"):
-                opps = self.analyzer.find_opportunities(snapshot)
-            elif hasattr(self.analyzer, "analyze_opportunities"):
-                opps = self.analyzer.analyze_opportunities(snapshot)
-            else:
-                opps = self.analyzer.analyze(snapshot)
+            opps = self._analyze_fn(snapshot)
         except Exception as e:
             self.log.warning(f"Analyzer error: {e}")
             return []
@@ -245,8 +252,8 @@ class ArbitrageBot:
 
         approved = True
         try:
-            if hasattr(self.risk_manager, "approve"):
-                approved = bool(self.risk_manager.approve(best))
+            if self._approve_fn:
+                approved = bool(self._approve_fn(best))
         except Exception as e:
             self.log.warning(f"Risk check failed: {e}")
             return
@@ -256,13 +263,10 @@ class ArbitrageBot:
 
         with self._trade_lock:
             try:
-                if hasattr(self.trade_executor, "execute_and_monitor_opportunity"):
-                    result = self.trade_executor.execute_and_monitor_opportunity(best)
-                elif hasattr(self.trade_executor, "execute_opportunity"):
-                    result = self.trade_executor.execute_opportunity(best)
-                else:
+                if self._execute_fn is None:
                     self.log.error("TradeExecutor has no execute_* method")
                     return
+                result = self._execute_fn(best)
 
                 self._process_trade_result(best, result)
             except Exception as e:
@@ -276,6 +280,9 @@ class ArbitrageBot:
             self.session_profit += float(result.get("pnl", 0.0))
         elif isinstance(result, dict) and result.get("status") == "neutralized":
             self.neutralized_trades += 1
+        elif isinstance(result, dict) and result.get("status") == "critical":
+            # A leg filled and its unwind did not: exposure is still open.
+            self.critical_failures += 1
         else:
             self.failed_trades += 1
 
@@ -296,9 +303,9 @@ class ArbitrageBot:
         return snapshot
 
     def _is_trade_in_progress(self) -> bool:
-        if hasattr(self.trade_executor, "is_busy"):
+        if self._is_busy_fn:
             try:
-                return bool(self.trade_executor.is_busy())
+                return bool(self._is_busy_fn())
             except Exception:
                 pass
         locked = not self._trade_lock.acquire(blocking=False)
@@ -306,6 +313,15 @@ class ArbitrageBot:
             self._trade_lock.release()
         return locked
 
+    @staticmethod
+    def _first_method(obj: Any, *names: str) -> Optional[Callable[..., Any]]:
+        """Returns the first bound method of obj among names, or None."""
+        for name in names:
+            fn = getattr(obj, name, None)
+            if callable(fn):
+                return fn
+        return None
+
     @staticmethod
     def _pick_best(opps: List[Opportunity]) -> Optional[Opportunity]:
         if not opps:
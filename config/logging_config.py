@@ -1,9 +1,21 @@
 # config/logging_config.py
 
+import atexit
+import copy
 import logging
 import json
 import os
-from logging.handlers import RotatingFileHandler
+import queue
+import time
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+
+try:  # C-accelerated JSON for the structured log, when installed
+    import orjson
+
+    def _dumps(obj) -> str:
+        return orjson.dumps(obj).decode()
+except ImportError:
+    _dumps = json.dumps
 
 # --- Custom Log Levels ---
 TRADE = 25
@@ -47,9 +59,82 @@ class JsonFormatter(logging.Formatter):
             "funcName": record.funcName,
             "lineNo": record.lineno
         }
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            log_object["exc_info"] = record.exc_text
+        return _dumps(log_object)
+
+
+# --- Queue hand-off ---
+class RecordQueueHandler(QueueHandler):
+    """
+    QueueHandler that leaves layout to the listener's formatters. The stock prepare() runs
+    the handler's formatter on the calling thread and folds the traceback into record.msg,
+    which drops the JSON sink's exc_info field; this one only renders the message and keeps
+    the traceback as exc_text.
+    """
+    _exc_formatter = logging.Formatter()
+
+    def prepare(self, record):
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        record.msg, record.args = record.message, None
         if record.exc_info:
-            log_object["exc_info"] = self.formatException(record.exc_info)
-        return json.dumps(log_object)
+            if not record.exc_text:
+                record.exc_text = self._exc_formatter.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+# --- Buffered file sink ---
+class BufferedRotatingFileHandler(RotatingFileHandler):
+    """
+    RotatingFileHandler writing through a 64 KiB buffer instead of flushing every record.
+    The buffer is flushed on WARNING and above, on rollover/close, and once FLUSH_INTERVAL_S
+    has passed since the last flush: checked on each record and, while the log is quiet, by
+    FlushingQueueListener's idle wake-ups. A hard kill can lose up to that window.
+    """
+    BUFFER_SIZE = 64 * 1024
+    FLUSH_INTERVAL_S = 30.0
+
+    def __init__(self, *args, **kwargs):
+        self._urgent = False
+        self._last_flush = time.monotonic()
+        super().__init__(*args, **kwargs)
+
+    def _open(self):
+        return open(self.baseFilename, self.mode, buffering=self.BUFFER_SIZE,
+                    encoding=self.encoding, errors=self.errors)
+
+    def emit(self, record):
+        self._urgent = record.levelno >= logging.WARNING
+        super().emit(record)
+
+    def flush(self):
+        # StreamHandler.emit calls this after every record; only honour it when due.
+        now = time.monotonic()
+        if self._urgent or now - self._last_flush >= self.FLUSH_INTERVAL_S:
+            super().flush()
+            self._last_flush = now
+
+
+class FlushingQueueListener(QueueListener):
+    """
+    QueueListener that wakes every IDLE_POLL_S while the queue is empty and offers its
+    handlers a flush, so buffered records still reach disk when nothing else is logged.
+    """
+    IDLE_POLL_S = 1.0
+
+    def dequeue(self, block):
+        while True:
+            try:
+                return self.queue.get(block, timeout=self.IDLE_POLL_S)
+            except queue.Empty:
+                if not block:
+                    raise
+                for handler in self.handlers:
+                    handler.flush()
 
 
 # --- Main Setup Function ---
@@ -60,6 +145,7 @@ def setup_logging(level=logging.INFO):
       - console handler
       - human-readable file handler
       - structured JSON file handler
+    The sinks run on a QueueListener thread; logging threads only enqueue the record.
     Safe to call multiple times (will not duplicate handlers).
     """
     setup_custom_log_levels()
@@ -68,6 +154,10 @@ def setup_logging(level=logging.INFO):
         return logger
 
     logger.setLevel(level)
+    # Nothing formats thread/process fields; skip collecting them on every LogRecord.
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
 
     # Create logs directory
     log_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), "logs")
@@ -75,24 +165,28 @@ def setup_logging(level=logging.INFO):
 
     # --- Human-readable log file ---
     human_file = os.path.join(log_dir, "bot.log")
-    human_format = "%(asctime)s - %(levelname)s - [%(module)s:%(lineno)d] - %(message)s"
-    human_handler = RotatingFileHandler(human_file, maxBytes=5*1024*1024, backupCount=2, mode='w')
-    human_handler.setFormatter(logging.Formatter(human_format))
+    human_formatter = logging.Formatter("%(asctime)s - %(levelname)s - [%(module)s:%(lineno)d] - %(message)s")
+    human_handler = BufferedRotatingFileHandler(human_file, maxBytes=5*1024*1024, backupCount=2, mode='w')
+    human_handler.setFormatter(human_formatter)
     human_handler.setLevel(level)
-    logger.addHandler(human_handler)
 
     # --- JSON structured log file ---
     json_file = os.path.join(log_dir, "bot_structured.log")
-    json_handler = RotatingFileHandler(json_file, maxBytes=5*1024*1024, backupCount=2, mode='w')
+    json_handler = BufferedRotatingFileHandler(json_file, maxBytes=5*1024*1024, backupCount=2, mode='w')
     json_handler.setFormatter(JsonFormatter())
     json_handler.setLevel(level)
-    logger.addHandler(json_handler)
 
     # --- Console handler ---
     console_handler = logging.StreamHandler()
-    console_handler.setFormatter(logging.Formatter(human_format))
+    console_handler.setFormatter(human_formatter)
     console_handler.setLevel(level)
-    logger.addHandler(console_handler)
+
+    # --- Hand the blocking sinks to a background listener ---
+    log_queue = queue.SimpleQueue()
+    logger.addHandler(RecordQueueHandler(log_queue))
+    listener = FlushingQueueListener(log_queue, human_handler, json_handler, console_handler, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
 
     logger._is_configured = True
     logger.info("Logging initialized -> human log: %s | json log: %s", human_file, json_file)
@@ -109,93 +203,3 @@ def get_logger(name: str | None = None) -> logging.Logger:
     """
     setup_logging()
     return logging.getLogger(name or "crypto_arbitrage_bot")
-
-
-# # logging_config.py
-
-# import logging
-# import json
-# from logging.handlers import RotatingFileHandler
-
-# def setup_custom_log_levels():
-#     """
-#     Adds custom TRADE and SUCCESS log levels and methods to Python's logging.
-#     This function is designed to be called by both the main app and the test suite.
-#     """
-#     # --- Custom Log Levels ---
-#     TRADE = 25
-#     SUCCESS = 26
-    
-#     # Check if levels are already added to avoid errors on re-import
-#     if not hasattr(logging, 'TRADE'):
-#         logging.addLevelName(TRADE, "TRADE")
-#         logging.TRADE = TRADE
-    
-#     if not hasattr(logging, 'SUCCESS'):
-#         logging.addLevelName(SUCCESS, "SUCCESS")
-#         logging.SUCCESS = SUCCESS
-
-#     # --- Custom Logger Methods ---
-#     def trade(self, message, *args, **kws):
-#         if self.isEnabledFor(TRADE):
-#             self._log(TRADE, message, args, **kws)
-
-#     def success(self, message, *args, **kws):
-#         if self.isEnabledFor(SUCCESS):
-#             self._log(SUCCESS, message, args, **kws)
-    
-#     # Add methods to the Logger class if they don't exist
-#     if not hasattr(logging.Logger, 'trade'):
-#         logging.Logger.trade = trade
-    
-#     if not hasattr(logging.Logger, 'success'):
-#         logging.Logger.success = success
-
-
-# # --- JSON Formatter for Structured Logging ---
-# class JsonFormatter(logging.Formatter):
-#     """Formats log records into a JSON string."""
-#     def format(self, record):
-#         log_object = {
-#             "timestamp": self.formatTime(record, self.datefmt),
-#             "level": record.levelname,
-#             "message": record.getMessage(),
-#             "module": record.module,
-#             "funcName": record.funcName,
-#             "lineNo": record.lineno
-#         }
-#         if record.exc_info:
-#             log_object['exc_info'] = self.formatException(record.exc_info)
-#         return json.dumps(log_object)
-
-# def setup_logging():
-#     """Configures the root logger for dual file output (human-readable and JSON)."""
-#     # First, ensure custom levels and methods are defined
-#     setup_custom_log_levels()
-    
-#     logger = logging.getLogger()
-#     logger.setLevel(logging.INFO)
-    
-#     # Clear any existing handlers
-#     if logger.hasHandlers():
-#         logger.handlers.clear()
-
-#     # --- Human-Readable Log File Handler ---
-#     log_format_string = '%(asctime)s - %(levelname)s - [%(module)s:%(lineno)d] - %(message)s'
-#     human_formatter = logging.Formatter(log_format_string)
-#     file_handler = RotatingFileHandler('bot.log', maxBytes=5*1024*1024, backupCount=2, mode='w')
-#     file_handler.setFormatter(human_formatter)
-#     logger.addHandler(file_handler)
-
-#     # --- Structured JSON Log File Handler ---
-#     json_formatter = JsonFormatter()
-#     json_handler = RotatingFileHandler('bot_structured.log', maxBytes=5*1024*1024, backupCount=2, mode='w')
-#     json_handler.setFormatter(json_formatter)
-#     logger.addHandler(json_handler)
-
-#     # --- Console Handler (for basic terminal output) ---
-#     console_handler = logging.StreamHandler()
-#     console_handler.setFormatter(human_formatter)
-#     logger.addHandler(console_handler)
-
-#     logging.info("Logging configured with human-readable, JSON, and console outputs.")
\ No newline at end of file
@@ -2,13 +2,19 @@ import ccxt
 import time
 import logging
 from typing import Any, Dict, Optional
+from requests.adapters import HTTPAdapter
 from core.utils import retry_ccxt_call, ExchangeInitError
 import threading
+from concurrent.futures import ThreadPoolExecutor
 
 
 class ExchangeManager:
     """Manages all exchange clients, API calls, and cached data — optimized for speed and thread safety."""
 
+    # Sized for the engine's order-book fan-out plus the balance/order threads, so
+    # concurrent calls reuse pooled keep-alive connections instead of new TLS handshakes.
+    HTTP_POOL_MAXSIZE = 16
+
     def __init__(self, exchanges_config: Dict[str, Any]):
         self.logger = logging.getLogger(__name__)
         self.clients: Dict[str, ccxt.Exchange] = {}
@@ -31,41 +37,77 @@ class ExchangeManager:
     # CLIENT INIT
     # ----------------------------------------------------------------------
     def _initialize_clients(self, exchanges_config: Dict[str, Any]):
+        pending: Dict[str, ccxt.Exchange] = {}
         for ex_name, config_data in exchanges_config.items():
             try:
                 exchange_class = getattr(ccxt, ex_name)
                 client = exchange_class(config_data)
                 if hasattr(client, "set_sandbox_mode"):
                     client.set_sandbox_mode(True)
-                retry_ccxt_call(client.load_markets)()
-                self.clients[ex_name] = client
-                self.logger.info(f"Initialized {ex_name.capitalize()} client.")
+                self._configure_http_session(client)
+                pending[ex_name] = client
             except Exception as e:
-                self.logger.critical(f"Error initializing {ex_name.capitalize()}: {e}")
-                raise ExchangeInitError(f"Failed to initialize {ex_name.capitalize()}: {e}")
+                raise self._init_error(ex_name, e)
+        if not pending:
+            return
+
+        # load_markets (network + parsing a large payload) dominates startup; run them side by
+        # side so it costs the slowest exchange, not the sum. It also warms the pooled
+        # connection before the first order goes out.
+        with ThreadPoolExecutor(max_workers=len(pending)) as pool:
+            futures = {
+                ex_name: pool.submit(retry_ccxt_call(client.load_markets))
+                for ex_name, client in pending.items()
+            }
+            for ex_name, fut in futures.items():
+                try:
+                    fut.result()
+                except Exception as e:
+                    raise self._init_error(ex_name, e)
+                self.clients[ex_name] = pending[ex_name]
+                self.logger.info(f"Initialized {ex_name.capitalize()} client.")
+
+    def _init_error(self, ex_name: str, e: Exception) -> ExchangeInitError:
+        self.logger.critical(f"Error initializing {ex_name.capitalize()}: {e}")
+        return ExchangeInitError(f"Failed to initialize {ex_name.capitalize()}: {e}")
+
+    def _configure_http_session(self, client: ccxt.Exchange) -> None:
+        """Mounts a larger keep-alive connection pool on the client's requests session."""
+        session = getattr(client, "session", None)
+        if session is None or not hasattr(session, "mount"):
+            return
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=self.HTTP_POOL_MAXSIZE)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        client.headers = {**(getattr(client, "headers", None) or {}), "Connection": "keep-alive"}
 
     def get_all_clients(self) -> Dict[str, ccxt.Exchange]:
         return self.clients
 
+    def get_client(self, ex_name: str) -> Optional[ccxt.Exchange]:
+        return self.clients.get(ex_name)
+
     # ----------------------------------------------------------------------
     # BALANCES (cached and throttled)
     # ----------------------------------------------------------------------
     def get_balance(self, client: ccxt.Exchange, force_refresh: bool = False) -> Optional[Dict[str, Any]]:
         """Fetch and cache per-exchange balances safely."""
+        now = time.time()
+        cid = client.id
         with self._lock:
-            now = time.time()
-            cid = client.id
             if not force_refresh and (now - self.last_balance_fetch_time.get(cid, 0)) < self.balance_cache_duration:
                 return self.cached_balances.get(cid)
 
-            try:
-                balance = retry_ccxt_call(client.fetch_balance)()
+        # The network call runs outside the lock so fetches for different exchanges overlap.
+        try:
+            balance = retry_ccxt_call(client.fetch_balance)()
+            with self._lock:
                 self.cached_balances[cid] = balance
                 self.last_balance_fetch_time[cid] = now
-                return balance
-            except Exception as e:
-                self.logger.warning(f"[{cid}] Balance fetch failed: {e}")
-                return self.cached_balances.get(cid)
+            return balance
+        except Exception as e:
+            self.logger.warning(f"[{cid}] Balance fetch failed: {e}")
+            return self.cached_balances.get(cid)
 
     def get_all_balances(self, force_refresh: bool = False) -> Dict[str, Dict[str, float]]:
         """Return a unified dict of balances for all exchanges (cached)."""
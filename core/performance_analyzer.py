@@ -1,63 +1,142 @@
 #Performance_Analyzer.py
 
-import pandas as pd
-import numpy as np
+from __future__ import annotations
+
+import csv
 import os
-from typing import Any, Dict, Optional
-from matplotlib.figure import Figure
-import matplotlib.pyplot as plt
-import matplotlib.dates as mdates
+from functools import lru_cache, wraps
+from typing import TYPE_CHECKING, Any, Dict, Optional
 import logging
 
+# pandas, numpy and matplotlib cost hundreds of ms to import; they are pulled in
+# by the methods that need them, the first time those run.
+if TYPE_CHECKING:
+    import pandas as pd
+    from matplotlib.figure import Figure
+
+@lru_cache(maxsize=1)
+def _csv_engine() -> str:
+    """pyarrow's multithreaded CSV reader when installed, else pandas' C engine."""
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return "c"
+    return "pyarrow"
+
+_STYLE_APPLIED = False
+
+def _apply_style() -> None:
+    """Applies the dark matplotlib style (process-global rcParams) once."""
+    global _STYLE_APPLIED
+    if not _STYLE_APPLIED:
+        from matplotlib import style as mpl_style
+        mpl_style.use('dark_background')
+        _STYLE_APPLIED = True
+
+def _cached_per_load(method):
+    """Memoizes a no-argument analyzer method until the next successful load_data()."""
+    name = method.__name__
+
+    @wraps(method)
+    def wrapper(self):
+        hit = self._result_cache.get(name)
+        if hit is not None and hit[0] == self._data_version:
+            return hit[1]
+        result = method(self)
+        self._result_cache[name] = (self._data_version, result)
+        return result
+    return wrapper
+
 class PerformanceAnalyzer:
     """
     Analyzes trade data from trades.csv to calculate performance metrics and generate charts.
     """
     TRADE_LOG_FILE = 'trades.csv'
+    # Only these columns are read: the KPI/chart inputs plus what the trade log table shows.
+    REQUIRED_COLUMNS = ('status', 'net_profit_usd', 'timestamp', 'symbol')
+    DISPLAY_COLUMNS = ('buy_exchange', 'sell_exchange')
 
     def __init__(self):
         self.trades_df: Optional[pd.DataFrame] = None
+        # SUCCESS rows of trades_df, filtered once per load for every consumer.
+        self._success_mask = None
+        self._successful: Optional[pd.DataFrame] = None
         self.logger = logging.getLogger(__name__)
-        # Use a style compatible with our dark theme
-        plt.style.use('dark_background')
+        # Bumped on every successful load; KPI/chart results are cached against it.
+        self._data_version = 0
+        # (st_mtime_ns, st_size) of trades.csv at the last successful load.
+        self._last_sig: Optional[tuple] = None
+        self._result_cache: Dict[str, tuple] = {}
+        self._figures: Dict[str, Figure] = {}
+        # The P/L curve's line; animated so the GUI can blit it over a cached background.
+        self.equity_line = None
 
     def load_data(self) -> bool:
         """
         Loads and preprocesses data from the trades CSV file with enhanced error handling.
         Returns True on success, False on failure.
+        An unchanged file (same mtime and size as the last successful load) costs one
+        stat() and keeps the current DataFrame and every cached result.
         """
+        import pandas as pd
+
         try:
-            if not os.path.exists(self.TRADE_LOG_FILE):
+            try:
+                st = os.stat(self.TRADE_LOG_FILE)
+                sig = (st.st_mtime_ns, st.st_size)
+                if sig == self._last_sig:
+                    return True
+                self._last_sig = None
+                with open(self.TRADE_LOG_FILE, newline='') as f:
+                    header = next(csv.reader(f), [])
+            except FileNotFoundError:
                 self.logger.warning(f"'{self.TRADE_LOG_FILE}' not found. No data to analyze.")
                 return False
-            
-            self.trades_df = pd.read_csv(self.TRADE_LOG_FILE)
-            if self.trades_df.empty:
-                self.logger.warning("trades.csv is empty. No data to analyze.")
-                return False
-            
+
             # --- MERGED: Check for required columns from your new script ---
-            required_cols = ['status', 'net_profit_usd', 'timestamp', 'symbol']
-            if not all(col in self.trades_df.columns for col in required_cols):
+            if header and not all(col in header for col in self.REQUIRED_COLUMNS):
                 self.logger.error("trades.csv is missing one or more required columns.")
                 return False
 
-            # Convert timestamp to datetime objects for proper plotting and analysis
-            self.trades_df['timestamp'] = pd.to_datetime(self.trades_df['timestamp'])
-            self.trades_df = self.trades_df.sort_values(by='timestamp')
+            wanted = self.REQUIRED_COLUMNS + self.DISPLAY_COLUMNS
+            self.trades_df = pd.read_csv(
+                self.TRADE_LOG_FILE,
+                engine=_csv_engine(),
+                usecols=[col for col in header if col in wanted],
+                dtype={'status': 'category', 'symbol': 'category'},
+                parse_dates=['timestamp'],
+            ) if header else pd.DataFrame()
+            if self.trades_df.empty:
+                self.logger.warning("trades.csv is empty. No data to analyze.")
+                return False
+
+            # Timestamps are parsed by read_csv; only fall back to to_datetime for odd formats.
+            if not pd.api.types.is_datetime64_any_dtype(self.trades_df['timestamp']):
+                self.trades_df['timestamp'] = pd.to_datetime(self.trades_df['timestamp'])
+            # The logger appends in time order, so the sort is normally skipped.
+            if not self.trades_df['timestamp'].is_monotonic_increasing:
+                self.trades_df = self.trades_df.sort_values(by='timestamp', kind='stable')
+            self._success_mask = (self.trades_df['status'] == 'SUCCESS').to_numpy()
+            self._successful = self.trades_df.loc[self._success_mask]
+            self._data_version += 1
+            self._last_sig = sig
             return True
         except Exception as e:
             self.logger.error(f"Error loading or processing trade data: {e}", exc_info=True)
             self.trades_df = None
+            self._successful = None
             return False
 
+    @_cached_per_load
     def calculate_kpis(self) -> Dict[str, Any]:
         """Calculates a dictionary of Key Performance Indicators (KPIs) with improved structure."""
+        import numpy as np
+
         if self.trades_df is None or self.trades_df.empty:
             return {}
 
         all_trades = self.trades_df
-        successful_trades = all_trades[all_trades['status'] == 'SUCCESS']
+        successful_trades = self._successful
         
         # --- MERGED: More robust handling of cases with no successful trades ---
         if successful_trades.empty:
@@ -69,19 +148,23 @@ class PerformanceAnalyzer:
         total_trades = len(all_trades)
         num_successful = len(successful_trades)
         win_rate = (num_successful / total_trades * 100) if total_trades > 0 else 0
-        net_pl = successful_trades['net_profit_usd'].sum()
-        
-        gross_profit = successful_trades[successful_trades['net_profit_usd'] > 0]['net_profit_usd'].sum()
-        gross_loss = abs(successful_trades[successful_trades['net_profit_usd'] < 0]['net_profit_usd'].sum())
+        # One pass out of pandas: every P/L reduction below works on the raw ndarray.
+        pnl = successful_trades['net_profit_usd'].to_numpy(dtype=np.float64)
+        net_pl = pnl.sum()
+
+        gross_profit = pnl[pnl > 0].sum()
+        gross_loss = -pnl[pnl < 0].sum()
         profit_factor = (gross_profit / gross_loss) if gross_loss > 0 else float('inf')
 
-        cumulative_pl = successful_trades['net_profit_usd'].cumsum()
-        peak = cumulative_pl.cummax()
-        drawdown = peak - cumulative_pl
-        max_drawdown = drawdown.max()
+        cumulative_pl = np.cumsum(pnl)
+        max_drawdown = float((np.maximum.accumulate(cumulative_pl) - cumulative_pl).max())
 
-        daily_returns = successful_trades.set_index('timestamp')['net_profit_usd'].resample('D').sum()
-        sharpe_ratio = (daily_returns.mean() / daily_returns.std()) * np.sqrt(365) if daily_returns.std() != 0 else 0.0
+        # Sum P/L per calendar day that actually had trades (no zero-filled calendar).
+        days = successful_trades['timestamp'].to_numpy().astype('datetime64[D]')
+        _, day_index = np.unique(days, return_inverse=True)
+        daily_returns = np.bincount(day_index, weights=pnl)
+        daily_std = daily_returns.std(ddof=1) if len(daily_returns) > 1 else 0.0
+        sharpe_ratio = (daily_returns.mean() / daily_std) * np.sqrt(365) if daily_std != 0 else 0.0
 
         return {
             "Total Trades": total_trades,
@@ -93,21 +176,26 @@ class PerformanceAnalyzer:
             "Sharpe Ratio": f"{sharpe_ratio:.2f}"
         }
 
-    def _create_figure(self) -> Figure:
-        """Helper to create a consistently styled matplotlib Figure for GUI embedding."""
-        fig = Figure(figsize=(10, 6), dpi=100, facecolor='#2B2B2B')
+    def _create_figure(self, name: str) -> Figure:
+        """Returns the chart's consistently styled Figure, created once and cleared for each redraw."""
+        fig = self._figures.get(name)
+        if fig is None:
+            from matplotlib.figure import Figure
+            # Use a style compatible with our dark theme
+            _apply_style()
+            fig = self._figures[name] = Figure(figsize=(10, 6), dpi=100, facecolor='#2B2B2B')
+        else:
+            fig.clear()
         return fig
 
-    def generate_equity_curve(self) -> Figure:
-        """Generates a chart showing the cumulative profit over time."""
-        fig = self._create_figure()
-        ax = fig.add_subplot(111)
+    def _build_equity_figure(self) -> Figure:
+        """Creates the P/L curve's axes, static decorations and (empty) line once."""
+        import matplotlib.dates as mdates
 
-        if self.trades_df is not None:
-            successful_trades = self.trades_df[self.trades_df['status'] == 'SUCCESS'].copy()
-            if not successful_trades.empty:
-                successful_trades['cumulative_profit'] = successful_trades['net_profit_usd'].cumsum()
-                ax.plot(successful_trades['timestamp'], successful_trades['cumulative_profit'], color='cyan', marker='o', linestyle='-', markersize=4)
+        fig = self._create_figure("equity_curve")
+        ax = fig.add_subplot(111)
+        ax.xaxis_date()
+        self.equity_line, = ax.plot([], [], color='cyan', marker='o', linestyle='-', markersize=4, animated=True)
 
         ax.set_title('Portfolio P/L Curve', color='white')
         ax.set_ylabel('Cumulative Profit (USD)', color='white')
@@ -119,19 +207,43 @@ class PerformanceAnalyzer:
         fig.tight_layout()
         return fig
 
+    @_cached_per_load
+    def generate_equity_curve(self) -> Figure:
+        """
+        Generates a chart showing the cumulative profit over time.
+        The axes are built once; later loads only swap the line's data and rescale.
+        """
+        import numpy as np
+
+        fig = self._figures.get("equity_curve")
+        if fig is None or self.equity_line is None:
+            fig = self._build_equity_figure()
+        line = self.equity_line
+
+        successful_trades = self._successful
+        if successful_trades is not None and not successful_trades.empty:
+            pnl = successful_trades['net_profit_usd'].to_numpy(dtype=np.float64, copy=False)
+            cumulative_profit = np.cumsum(pnl, out=np.empty_like(pnl))
+            line.set_data(successful_trades['timestamp'].to_numpy(), cumulative_profit)
+        else:
+            line.set_data([], [])
+        line.axes.relim()
+        line.axes.autoscale_view()
+        return fig
+
+    @_cached_per_load
     def generate_profit_by_symbol_chart(self) -> Figure:
         """Generates a bar chart showing net profit for each symbol with conditional coloring."""
-        fig = self._create_figure()
+        fig = self._create_figure("profit_by_symbol")
         ax = fig.add_subplot(111)
 
-        if self.trades_df is not None:
-            successful_trades = self.trades_df[self.trades_df['status'] == 'SUCCESS'].copy()
-            if not successful_trades.empty:
-                profit_by_symbol = successful_trades.groupby('symbol')['net_profit_usd'].sum().sort_values(ascending=False)
-                
-                # --- MERGED: Conditional bar coloring from your new script ---
-                colors = ['#00BCD4' if x >= 0 else '#E57373' for x in profit_by_symbol.values]
-                profit_by_symbol.plot(kind='bar', ax=ax, color=colors)
+        successful_trades = self._successful
+        if successful_trades is not None and not successful_trades.empty:
+            profit_by_symbol = successful_trades.groupby('symbol', observed=True)['net_profit_usd'].sum().sort_values(ascending=False)
+
+            # --- MERGED: Conditional bar coloring from your new script ---
+            colors = ['#00BCD4' if x >= 0 else '#E57373' for x in profit_by_symbol.values]
+            profit_by_symbol.plot(kind='bar', ax=ax, color=colors)
 
         ax.set_title('Net Profit by Symbol', color='white')
         ax.set_ylabel('Total Net Profit (USD)', color='white')
@@ -8,13 +8,23 @@
 """
 
 import logging
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Any, Dict, Optional
 
-from data_models import Opportunity
+from data_models import Opportunity, PortfolioSnapshot
 from core.exchange_manager import ExchangeManager
 
 
+def _free_bal(bal: Any, asset: str) -> float:
+    """Free amount of asset in a ccxt balance dict; 0.0 when missing or unset."""
+    try:
+        return float(bal["free"][asset])
+    except (KeyError, TypeError, ValueError):
+        return 0.0
+
+
 class RiskManager:
     def __init__(self, config: Dict[str, Any], exchange_manager: ExchangeManager):
         self.config = config or {}
@@ -24,96 +34,156 @@ class RiskManager:
 
         # portfolio deployment tracking
         self.capital_deployed_usd: float = 0.0
+        # Serializes commit/release read-modify-writes; plain reads stay lock-free.
+        self._capital_lock = threading.Lock()
         self.total_portfolio_value_usd: float = 0.0
-        self.last_portfolio_update_ts: float = 0.0
+        # Tiered freshness: "fast" (kill switch) and "slow" (deployment limit) monotonic
+        # deadlines until which total_portfolio_value_usd is considered fresh.
+        self._portfolio_valid_until: float = 0.0
+        self._portfolio_valid_until_slow: float = 0.0
         self._portfolio_ttl_s: int = int(self.risk_config.get("portfolio_recalc_ttl_s", 30))
+        self._portfolio_ttl_slow_s: int = int(self.risk_config.get("portfolio_recalc_ttl_slow_s", 300))
+        # Scalar risk limits, read once instead of on every check.
+        self._max_trade_size_usdt: float = float(self.risk_config.get("max_trade_size_usdt", 20.0))
+        self._balance_pct_per_trade: float = float(self.risk_config.get("balance_percentage_per_trade", 1.0))
+        self._kill_switch_threshold: float = float(self.risk_config.get("balance_kill_switch_usd", 0) or 0)
+        self._max_pct: float = float(self.risk_config.get("max_capital_deployment_percentage", 25.0)) / 100.0
+        # total_portfolio_value_usd * _max_pct, refreshed whenever the total changes.
+        self._max_deployable_usd: float = 0.0
+        # Half the limit: below it a check can skip the portfolio refresh entirely.
+        self._safe_zone_usd: float = 0.0
+        # Result of the last successful portfolio refresh.
+        self._snapshot: Optional[PortfolioSnapshot] = None
+        # Pre-trade checks rejected on the quote side before the sell-side balance was fetched.
+        self._balance_fastfail_count: int = 0
+        # exchange id -> client; clients live as long as the ExchangeManager.
+        self._client_cache: Dict[str, Any] = {}
+
+    @property
+    def balance_fastfail_count(self) -> int:
+        """Pre-trade checks rejected on the quote side without fetching the sell-side balance."""
+        return self._balance_fastfail_count
 
     # -------------------------
     # Portfolio / deployment
     # -------------------------
-    def _update_total_portfolio_value(self) -> None:
-        """Recalculate total portfolio value in USD. Prefer exchange_manager.get_total_balance_usdt if available."""
+    def _client(self, ex_id: str) -> Any:
+        c = self._client_cache.get(ex_id)
+        if c is None:
+            c = self.exchange_manager.get_client(ex_id)
+            if c is not None:
+                self._client_cache[ex_id] = c
+        return c
+
+    def _recompute_max_deployable(self) -> None:
+        self._max_deployable_usd = self.total_portfolio_value_usd * self._max_pct
+        self._safe_zone_usd = self._max_deployable_usd * 0.5
+
+    def _store_snapshot(self, total_value: float) -> PortfolioSnapshot:
+        now = time.monotonic()
+        self.total_portfolio_value_usd = total_value
+        self._portfolio_valid_until = now + self._portfolio_ttl_s
+        self._portfolio_valid_until_slow = now + self._portfolio_ttl_slow_s
+        self._recompute_max_deployable()
+        self._snapshot = PortfolioSnapshot(total_value, self.capital_deployed_usd, now)
+        return self._snapshot
+
+    def _update_total_portfolio_value(self, freshness: str = "slow") -> Optional[PortfolioSnapshot]:
+        """
+        Recalculate total portfolio value in USD. Prefer exchange_manager.get_total_balance_usdt if available.
+        freshness "fast" applies portfolio_recalc_ttl_s, "slow" portfolio_recalc_ttl_slow_s
+        (committed capital is tracked locally, so deployment checks tolerate an older total).
+        Returns the current snapshot (None until the first successful refresh).
+        """
         try:
-            now = time.time()
-            if (now - self.last_portfolio_update_ts) < self._portfolio_ttl_s and self.total_portfolio_value_usd > 0:
-                return
+            valid_until = self._portfolio_valid_until if freshness == "fast" else self._portfolio_valid_until_slow
+            if time.monotonic() < valid_until and self.total_portfolio_value_usd > 0:
+                return self._snapshot
 
             # Try to use a helper on ExchangeManager if it exists
             try:
                 total = self.exchange_manager.get_total_balance_usdt()
                 if total is not None:
-                    self.total_portfolio_value_usd = float(total)
-                    self.last_portfolio_update_ts = now
-                    self.logger.info(f"Total portfolio value updated (via helper): ${self.total_portfolio_value_usd:,.2f}")
-                    return
+                    snap = self._store_snapshot(float(total))
+                    self.logger.info("Total portfolio value updated (via helper): $%.2f", self.total_portfolio_value_usd)
+                    return snap
             except Exception:
                 # fallback to manual aggregation
                 self.logger.debug("exchange_manager.get_total_balance_usdt() unavailable or failed; falling back to manual calculation.")
 
-            total_value = 0.0
+            vals = []
             clients = {}
             try:
                 clients = self.exchange_manager.get_all_clients() or {}
             except Exception:
                 clients = getattr(self.exchange_manager, "clients", {}) or {}
 
-            for client in (clients.values() if isinstance(clients, dict) else clients):
-                try:
-                    balance = self.exchange_manager.get_balance(client)
-                    if balance and "free" in balance:
-                        total_value += float(balance["free"].get("USDT", 0.0) or 0.0)
-                except Exception as e:
-                    self.logger.debug(f"Skipping client for portfolio calc due to: {e}")
+            # One balance round-trip per exchange; fan them out so a refresh costs ~max RTT, not the sum.
+            client_list = list(clients.values() if isinstance(clients, dict) else clients)
+            if client_list:
+                with ThreadPoolExecutor(max_workers=min(16, len(client_list))) as ex:
+                    futs = [ex.submit(self.exchange_manager.get_balance, c) for c in client_list]
+                    for fut in as_completed(futs):
+                        try:
+                            balance = fut.result()
+                            if balance:
+                                vals.append(_free_bal(balance, "USDT"))
+                        except Exception as e:
+                            self.logger.debug("Skipping client for portfolio calc due to: %s", e)
+
+            # Large sub-account sets reduce in C; a handful of exchanges isn't worth the numpy import.
+            if len(vals) >= 32:
+                import numpy as np
+                total_value = float(np.fromiter(vals, dtype=np.float64, count=len(vals)).sum())
+            else:
+                total_value = sum(vals)
 
             if total_value > 0:
-                self.total_portfolio_value_usd = total_value
-                self.last_portfolio_update_ts = now
-                self.logger.info(f"Total portfolio value updated (manual): ${self.total_portfolio_value_usd:,.2f}")
+                snap = self._store_snapshot(total_value)
+                self.logger.info("Total portfolio value updated (manual): $%.2f", self.total_portfolio_value_usd)
+                return snap
         except Exception as e:
             self.logger.error(f"Failed to update portfolio value: {e}", exc_info=True)
+        return self._snapshot
 
     def can_deploy_capital(self, trade_size_usdt: float) -> bool:
-        """Check if committing this trade would exceed configured capital deployment percentage."""
-        try:
-            self._update_total_portfolio_value()
-            max_pct = float(self.risk_config.get("max_capital_deployment_percentage", 25.0))
-            if self.total_portfolio_value_usd <= 0:
-                # if unknown, be conservative and allow small trades
-                self.logger.warning("Total portfolio unknown — allowing deployment cautiously.")
-                return True
-
-            max_deployable = self.total_portfolio_value_usd * (max_pct / 100.0)
-            potential = self.capital_deployed_usd + float(trade_size_usdt)
+        """
+        Check if committing this trade would exceed configured capital deployment percentage.
+        Unguarded: unexpected errors propagate through approve() to ArbitrageBot's risk-check guard.
+        """
+        # Well inside the limit, and the total is still within the slow TTL: skip the refresh.
+        if (self.capital_deployed_usd + trade_size_usdt < self._safe_zone_usd
+                and self.total_portfolio_value_usd > 0
+                and time.monotonic() < self._portfolio_valid_until_slow):
+            return True
+        self._update_total_portfolio_value(freshness="slow")
+        if self.capital_deployed_usd + float(trade_size_usdt) <= self._max_deployable_usd:
+            return True
 
-            if potential > max_deployable:
-                self.logger.warning(
-                    f"DEPLOYMENT LIMIT: Cannot commit ${trade_size_usdt:,.2f}. "
-                    f"Would exceed ${max_deployable:,.2f} ({max_pct}% of portfolio). "
-                    f"Currently deployed: ${self.capital_deployed_usd:,.2f}"
-                )
-                return False
+        if self.total_portfolio_value_usd <= 0:
+            # if unknown, be conservative and allow small trades
+            self.logger.warning("Total portfolio unknown — allowing deployment cautiously.")
             return True
-        except Exception as e:
-            self.logger.error(f"Error in can_deploy_capital: {e}", exc_info=True)
-            return False
+
+        if self.logger.isEnabledFor(logging.WARNING):
+            self.logger.warning(
+                f"DEPLOYMENT LIMIT: Cannot commit ${trade_size_usdt:,.2f}. "
+                f"Would exceed ${self._max_deployable_usd:,.2f} ({self._max_pct * 100:g}% of portfolio). "
+                f"Currently deployed: ${self.capital_deployed_usd:,.2f}"
+            )
+        return False
 
     def commit_capital(self, trade_size_usdt: float) -> None:
         """Mark capital as deployed (should be called once both orders placed / reserved)."""
-        try:
-            self.capital_deployed_usd += float(trade_size_usdt)
-            self.logger.info(f"Capital COMMITTED (+${trade_size_usdt:,.2f}). Total deployed: ${self.capital_deployed_usd:,.2f}")
-        except Exception as e:
-            self.logger.error(f"Failed to commit capital: {e}", exc_info=True)
+        with self._capital_lock:
+            self.capital_deployed_usd = max(0.0, self.capital_deployed_usd + float(trade_size_usdt))
+        self.logger.info("Capital COMMITTED (+$%.2f). Total deployed: $%.2f", float(trade_size_usdt), self.capital_deployed_usd)
 
     def release_capital(self, trade_size_usdt: float) -> None:
         """Release capital after trade completion/cancellation."""
-        try:
-            self.capital_deployed_usd -= float(trade_size_usdt)
-            if self.capital_deployed_usd < 0:
-                self.capital_deployed_usd = 0.0
-            self.logger.info(f"Capital RELEASED (-${trade_size_usdt:,.2f}). Total deployed: ${self.capital_deployed_usd:,.2f}")
-        except Exception as e:
-            self.logger.error(f"Failed to release capital: {e}", exc_info=True)
+        with self._capital_lock:
+            self.capital_deployed_usd = max(0.0, self.capital_deployed_usd - float(trade_size_usdt))
+        self.logger.info("Capital RELEASED (-$%.2f). Total deployed: $%.2f", float(trade_size_usdt), self.capital_deployed_usd)
 
     # -------------------------
     # Dynamic sizing
@@ -124,10 +194,10 @@ class RiskManager:
         capped by max_trade_size_usdt.
         """
         try:
-            pct = float(self.risk_config.get("balance_percentage_per_trade", 1.0))
-            max_size = float(self.risk_config.get("max_trade_size_usdt", 20.0))
+            pct = self._balance_pct_per_trade
+            max_size = self._max_trade_size_usdt
 
-            client = self.exchange_manager.get_client(buy_exchange_id)
+            client = self._client(buy_exchange_id)
             if not client:
                 self.logger.debug("No buy client found for dynamic size.")
                 return 0.0
@@ -137,13 +207,13 @@ class RiskManager:
                 self.logger.debug("No balance for dynamic size calculation.")
                 return 0.0
 
-            available = float(balance.get("free", {}).get(quote_currency, 0.0) or 0.0)
+            available = _free_bal(balance, quote_currency)
             size_from_balance = available * (pct / 100.0)
             final = min(size_from_balance, max_size)
             if final < 1.0:
                 return 0.0
 
-            self.logger.info(f"Dynamic size: ${final:.2f} ({pct}% of ${available:.2f}, capped at ${max_size:.2f})")
+            self.logger.info("Dynamic size: $%.2f (%s%% of $%.2f, capped at $%.2f)", final, pct, available, max_size)
             return final
         except Exception as e:
             self.logger.error(f"Error calculating dynamic trade size: {e}", exc_info=True)
@@ -154,85 +224,104 @@ class RiskManager:
     # -------------------------
     # In risk_manager.py
 
+    def _fetch_fresh_balance(self, client: Any, opportunity: Opportunity) -> Optional[Dict[str, Any]]:
+        try:
+            return self.exchange_manager.get_balance(client, force_refresh=True)
+        except Exception as e:
+            self.logger.error(f"Error during balance check for {opportunity.symbol}: {e}", exc_info=True)
+            return None
+
     def check_balances(self, opportunity: Opportunity, trade_size_usdt: float) -> bool:
         """
         Checks if sufficient funds are available on the specific exchanges
         required for the arbitrage trade.
+        Only the balance fetches are guarded; anything else propagates through approve()
+        to ArbitrageBot's risk-check guard.
         """
-        try:
-            buy_exchange_id = opportunity.buy_exchange
-            sell_exchange_id = opportunity.sell_exchange
-            
-            buy_client = self.exchange_manager.get_client(buy_exchange_id)
-            sell_client = self.exchange_manager.get_client(sell_exchange_id)
-            if not buy_client or not sell_client:
-                self.logger.warning("One or both exchange clients unavailable for balance check.")
-                return False
+        buy_exchange_id = opportunity.buy_exchange
+        sell_exchange_id = opportunity.sell_exchange
+        
+        buy_client = self._client(buy_exchange_id)
+        sell_client = self._client(sell_exchange_id)
+        if not buy_client or not sell_client:
+            self.logger.warning("One or both exchange clients unavailable for balance check.")
+            return False
 
-            base, quote = opportunity.symbol.split("/")
-            
-            # Fetch balances for the specific exchanges
-            buy_bal = self.exchange_manager.get_balance(buy_client, force_refresh=True)
-            sell_bal = self.exchange_manager.get_balance(sell_client, force_refresh=True)
+        base, quote = opportunity.base, opportunity.quote
+        
+        required_quote = float(trade_size_usdt)
+        required_base = opportunity.amount
 
-            if not buy_bal or not sell_bal:
-                self.logger.warning("Could not obtain fresh balances for pre-trade check.")
-                return False
+        # 1. Check quote currency balance on the BUY exchange. Most rejections fail here,
+        #    so the sell-side balance is only fetched once the quote side passes.
+        buy_bal = self._fetch_fresh_balance(buy_client, opportunity)
+        if not buy_bal:
+            self.logger.warning("Could not obtain fresh balances for pre-trade check.")
+            return False
 
-            # Get available (free) balances
-            available_quote = float(buy_bal.get("free", {}).get(quote, 0.0) or 0.0)
-            available_base = float(sell_bal.get("free", {}).get(base, 0.0) or 0.0)
-            
-            required_quote = float(trade_size_usdt)
-            required_base = opportunity.amount
+        available_quote = _free_bal(buy_bal, quote)
+        if available_quote < required_quote:
+            self._balance_fastfail_count += 1
+            self.logger.warning(
+                f"Insufficient {quote} on {opportunity.buy_exchange_upper}. "
+                f"Need: {required_quote:.2f}, Have: {available_quote:.2f}"
+            )
+            self.logger.debug(f"Quote-side balance fast-fails so far: {self._balance_fastfail_count}")
+            return False
 
-            # --- NEW: SEPARATE CHECKS FOR CLEARER LOGGING ---
+        # 2. Check base currency balance on the SELL exchange
+        sell_bal = buy_bal if sell_client is buy_client else self._fetch_fresh_balance(sell_client, opportunity)
+        if not sell_bal:
+            self.logger.warning("Could not obtain fresh balances for pre-trade check.")
+            return False
 
-            # 1. Check quote currency balance on the BUY exchange
-            if available_quote < required_quote:
-                self.logger.warning(
-                    f"Insufficient {quote} on {buy_exchange_id.upper()}. "
-                    f"Need: {required_quote:.2f}, Have: {available_quote:.2f}"
-                )
-                return False
+        available_base = _free_bal(sell_bal, base)
+        if available_base < required_base:
+            self.logger.warning(
+                f"Insufficient {base} on {opportunity.sell_exchange_upper}. "
+                f"Need: {required_base:.6f}, Have: {available_base:.6f}"
+            )
+            return False
 
-            # 2. Check base currency balance on the SELL exchange
-            if available_base < required_base:
-                self.logger.warning(
-                    f"Insufficient {base} on {sell_exchange_id.upper()}. "
-                    f"Need: {required_base:.6f}, Have: {available_base:.6f}"
-                )
-                return False
+        return True
 
-            return True
-        except Exception as e:
-            self.logger.error(f"Error during balance check for {opportunity.symbol}: {e}", exc_info=True)
-            return False
+    # -------------------------
+    # Pre-trade approval
+    # -------------------------
+    def approve(self, opportunity: Opportunity) -> bool:
+        """
+        Single pre-trade gate, resolved by ArbitrageBot as its approve hook. The checks run
+        without their own try/except; the engine's guard around this call logs and skips the
+        opportunity if one raises.
+        """
+        trade_size_usdt = float(opportunity.amount) * float(opportunity.buy_price)
+        return self.can_deploy_capital(trade_size_usdt) and self.check_balances(opportunity, trade_size_usdt)
 
     # -------------------------
     # Kill switch
     # -------------------------
-    def check_kill_switch(self) -> bool:
+    def check_kill_switch(self, portfolio: Optional[PortfolioSnapshot] = None) -> bool:
         """
         If total USDT portfolio < configured threshold -> return True (kill).
         If threshold <= 0 -> disabled.
+        Pass the snapshot from _update_total_portfolio_value to avoid a second refresh in the same tick;
+        otherwise the total is refreshed on the fast TTL tier.
         """
         try:
-            threshold = float(self.risk_config.get("balance_kill_switch_usd", 0) or 0)
+            threshold = self._kill_switch_threshold
             if threshold <= 0:
                 return False
 
-            # ensure portfolio value is up-to-date
-            if not self.total_portfolio_value_usd:
-                self._update_total_portfolio_value()
+            snap = portfolio or self._update_total_portfolio_value(freshness="fast")
+            total = snap.total_usd if snap else 0.0
 
-            if self.total_portfolio_value_usd <= 0:
+            if total <= 0:
                 self.logger.warning("Cannot evaluate kill switch: unknown portfolio value.")
                 return False
 
-            if self.total_portfolio_value_usd < threshold:
+            if total < threshold:
                 self.logger.critical(
-                    f"KILL SWITCH: Total USDT (${self.total_portfolio_value_usd:,.2f}) below threshold ${threshold}."
+                    f"KILL SWITCH: Total USDT (${total:,.2f}) below threshold ${threshold}."
                 )
                 return True
             return False
@@ -1,9 +1,14 @@
 # core/trade_executor.py
 from __future__ import annotations
+import atexit
+import logging
 import time
 import threading
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeout
 from typing import Any, Optional, Callable, Dict
 
+import ccxt
+
 from config.logging_config import get_logger
 
 
@@ -17,7 +22,15 @@ class TradeExecutor:
     - Provide busy flag and request_stop() for lifecycle coordination.
     - Stream progress via an optional callback.
     - Directly uses ccxt clients via ExchangeManager.clients for speed.
+    - Places both legs concurrently; a leg that fills while the other does not is unwound.
     """
+    FILLED_STATUSES = ("closed", "filled")
+    # Failure classification, most specific first (InsufficientFunds is an ExchangeError).
+    ERROR_KINDS = (
+        (ccxt.InsufficientFunds, "insufficient_funds"),
+        (ccxt.NetworkError, "network"),
+        (ccxt.ExchangeError, "exchange"),
+    )
 
     def __init__(self, exchange_manager: Any):
         self.log = get_logger(__name__)
@@ -25,12 +38,19 @@ class TradeExecutor:
         self._busy = False
         self._stop_evt = threading.Event()
         self._progress_cb: Optional[Callable[[str], None]] = None
+        # One worker per leg, kept for the executor's lifetime.
+        self._leg_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="trade-leg")
+        # create_order calls run here so a hanging endpoint can be abandoned after order_timeout_s.
+        self._order_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="trade-order")
 
         # Runtime params (can be tweaked at runtime via set_runtime_params)
         self.default_monitor_timeout_s: float = 30.0
+        self.order_timeout_s: float = 5.0
         self.min_poll_s: float = 0.15
         self.max_poll_s: float = 0.75
 
+        atexit.register(self.close)
+
     # -------- Lifecycle --------
 
     def set_progress_callback(self, cb: Optional[Callable[[str], None]]) -> None:
@@ -47,6 +67,12 @@ class TradeExecutor:
     def is_stopping(self) -> bool:
         return self._stop_evt.is_set()
 
+    def close(self) -> None:
+        """Stop monitoring and release the leg/order worker threads; queued work is dropped."""
+        self._stop_evt.set()
+        self._leg_pool.shutdown(wait=False, cancel_futures=True)
+        self._order_pool.shutdown(wait=False, cancel_futures=True)
+
     def set_busy(self, value: bool) -> None:
         self._busy = bool(value)
 
@@ -59,10 +85,13 @@ class TradeExecutor:
         monitor_timeout_s: Optional[float] = None,
         min_poll_s: Optional[float] = None,
         max_poll_s: Optional[float] = None,
+        order_timeout_s: Optional[float] = None,
     ) -> None:
         """Allow the engine/GUI to tune speed without code changes."""
         if monitor_timeout_s is not None:
             self.default_monitor_timeout_s = float(monitor_timeout_s)
+        if order_timeout_s is not None:
+            self.order_timeout_s = max(0.5, float(order_timeout_s))
         if min_poll_s is not None:
             self.min_poll_s = max(0.05, float(min_poll_s))
         if max_poll_s is not None:
@@ -79,22 +108,37 @@ class TradeExecutor:
         self.set_busy(True)
         try:
             oid = getattr(opportunity, "id", None)
-            self._emit(f"Executing opportunity {oid or '<no-id>'}")
+            self._emit("Executing opportunity %s", oid or '<no-id>')
 
             legs = self._build_legs(opportunity)
 
-            # Leg 1
-            leg1_res = self._place_and_wait(legs[0], opportunity)
-
-            if self.is_stopping():
-                self._emit("Stopping after leg1 due to stop request")
-                return {"status": "stopped", "leg1": leg1_res}
-
-            # Leg 2 (hedge/exit)
-            leg2_res = self._place_and_wait(legs[1], opportunity)
+            reason = self._precheck_legs(legs, opportunity)
+            if reason:
+                self._emit("Rejected before placing orders: %s", reason)
+                return {"status": "rejected", "error": reason}
+
+            # Both legs go out at once: wall time is max(leg latency), not the sum.
+            futures = [self._leg_pool.submit(self._place_and_wait, leg, opportunity) for leg in legs]
+            results = []
+            for fut in futures:
+                try:
+                    results.append(fut.result())
+                except Exception as e:
+                    results.append(e)
+            leg1_res, leg2_res = results
+
+            # A leg that raised or ended timeout/canceled/rejected/unknown is not filled; whatever
+            # quantity did fill on either leg is open exposure and must be unwound.
+            filled = [self._is_filled(r) for r in results]
+            if not all(filled):
+                exposed = any(self._filled_amount(r) > 0 for r in results)
+                if self.is_stopping() and not exposed and not any(isinstance(r, Exception) for r in results):
+                    self._emit("Stopping after legs due to stop request")
+                    return {"status": "stopped", "leg1": leg1_res, "leg2": leg2_res}
+                return self._handle_leg_failure(legs, results, opportunity)
 
             pnl = self._compute_pnl(opportunity, leg1_res, leg2_res)
-            self._emit(f"Trade completed. PnL={pnl:.4f}")
+            self._emit("Trade completed. PnL=%.4f", pnl)
 
             return {
                 "status": "filled",
@@ -104,19 +148,134 @@ class TradeExecutor:
             }
 
         except Exception as e:
-            self.log.exception("Trade execution error: %s", e)
-            return {"status": "failed", "error": str(e)}
+            kind = self._log_failure(e, opportunity)
+            return {"status": "failed", "kind": kind, "error": str(e)}
         finally:
             self.set_busy(False)
 
     # -------- Internals --------
 
+    @classmethod
+    def _error_kind(cls, error: Exception) -> str:
+        for exc_type, kind in cls.ERROR_KINDS:
+            if isinstance(error, exc_type):
+                return kind
+        return "unexpected"
+
+    def _log_failure(self, error: Exception, opportunity: Any) -> str:
+        """
+        One audit line per failed trade. The traceback of a non-ccxt error is only
+        captured at DEBUG, keeping traceback formatting off the execution path.
+        """
+        kind = self._error_kind(error)
+        self.log.error("trade_failed kind=%s symbol=%s err=%r", kind, getattr(opportunity, "symbol", None), error)
+        if kind == "unexpected" and self.log.isEnabledFor(logging.DEBUG):
+            self.log.debug("trade_failed traceback", exc_info=error)
+        return kind
+
+    @classmethod
+    def _is_filled(cls, result: Any) -> bool:
+        return isinstance(result, dict) and result.get("status") in cls.FILLED_STATUSES
+
+    @staticmethod
+    def _filled_amount(result: Any) -> float:
+        return float(result.get("filled") or 0.0) if isinstance(result, dict) else 0.0
+
+    @classmethod
+    def _info_filled(cls, info: Dict[str, Any], amount: float) -> float:
+        """Filled quantity of a ccxt order; a closed order that omits `filled` counts as complete."""
+        filled = info.get("filled")
+        if filled is not None:
+            return float(filled)
+        return amount if str(info.get("status", "")).lower() in cls.FILLED_STATUSES else 0.0
+
+    def _handle_leg_failure(self, legs, results, opportunity: Any) -> Dict[str, Any]:
+        """
+        Unwinds the filled quantity of every leg, full or partial, once the pair did not
+        complete. Reports "neutralized" only when every unwind filled; a failed hedge is
+        "critical" (exposure is still open).
+        """
+        error = next((r for r in results if isinstance(r, Exception)), None)
+        if error is not None:
+            kind = self._log_failure(error, opportunity)
+            message = str(error)
+        else:
+            kind = "unfilled"
+            message = "; ".join(
+                f"{leg['side']} leg {res.get('status')}" for leg, res in zip(legs, results) if not self._is_filled(res)
+            )
+            self.log.error("trade_failed kind=%s symbol=%s err=%s", kind, getattr(opportunity, "symbol", None), message)
+
+        unwound = [
+            self._unwind_leg(leg, self._filled_amount(res), opportunity)
+            for leg, res in zip(legs, results) if self._filled_amount(res) > 0
+        ]
+        if not unwound:
+            status = "failed"
+        elif all(self._is_filled(u) for u in unwound):
+            status = "neutralized"
+        else:
+            status = "critical"
+            self.log.critical("Hedge FAILED for %s: position left open on %s",
+                              getattr(opportunity, "symbol", None),
+                              ", ".join(str(u.get("exchange")) for u in unwound if not self._is_filled(u)))
+        return {
+            "status": status,
+            "kind": kind,
+            "error": message,
+            "leg1": results[0] if isinstance(results[0], dict) else str(results[0]),
+            "leg2": results[1] if isinstance(results[1], dict) else str(results[1]),
+            "unwind": unwound,
+        }
+
+    def _unwind_leg(self, leg: Dict[str, Any], amount: float, opportunity: Any) -> Dict[str, Any]:
+        """Places the compensating market order for the filled `amount` of a leg."""
+        reverse = dict(leg, side="sell" if leg["side"] == "buy" else "buy", type="market", price=None, amount=amount)
+        self._emit("Unwinding %s %s leg on %s with a market %s", amount, leg['side'], leg['exchange'], reverse['side'])
+        try:
+            return self._place_and_wait(reverse, opportunity)
+        except Exception as e:
+            self.log.critical("Unwind of %s leg on %s failed: %s", leg["side"], leg["exchange"], e)
+            return {"exchange": leg["exchange"], "side": reverse["side"], "status": "failed", "error": str(e)}
+
     def _client(self, exchange_id: str):
         clients = getattr(self.exchange_manager, "clients", {})
         if exchange_id not in clients:
             raise ValueError(f"Unknown exchange id: {exchange_id}")
         return clients[exchange_id]
 
+    def _precheck_legs(self, legs, opportunity: Any) -> Optional[str]:
+        """
+        Rejects legs that would predictably bounce (below the market's min amount/cost, or
+        more than the last cached free balance) without spending an order round-trip.
+        The exchange remains the authority; this only uses data already in memory.
+        """
+        if getattr(opportunity, "dry_run", False):
+            return None
+        cached_balances = getattr(self.exchange_manager, "cached_balances", {})
+        for leg in legs:
+            client = self._client(str(leg["exchange"]))
+            market = (getattr(client, "markets", None) or {}).get(leg["symbol"])
+            if not market:
+                continue
+            amount, price = leg["amount"], leg["price"]
+            limits = market.get("limits") or {}
+            min_amount = (limits.get("amount") or {}).get("min")
+            if min_amount and amount < min_amount:
+                return f"{leg['side']} amount {amount} below {leg['exchange']} minimum {min_amount}"
+            min_cost = (limits.get("cost") or {}).get("min")
+            if min_cost and price and amount * price < min_cost:
+                return f"{leg['side']} cost {amount * price:.2f} below {leg['exchange']} minimum {min_cost}"
+
+            if leg["side"] == "buy":
+                asset, needed = market.get("quote"), amount * price if price else None
+            else:
+                asset, needed = market.get("base"), amount
+            have = ((cached_balances.get(client.id) or {}).get("free") or {}).get(asset)
+            if needed is not None and have is not None and float(have) < needed:
+                return f"insufficient cached {asset} on {leg['exchange']}: need {needed:.6f}, have {float(have):.6f}"
+        return None
+
     def _build_legs(self, opportunity: Any):
         """
         Translate an opportunity into two executable legs.
@@ -172,31 +331,32 @@ class TradeExecutor:
 
         # --- DRY RUN: simulate instantly ---
         if dry_run:
-            self._emit(f"[DRY RUN] {otype} {side} {amount} {symbol} on {ex_id} (price={price})")
+            self._emit("[DRY RUN] %s %s %s %s on %s (price=%s)", otype, side, amount, symbol, ex_id, price)
             return {
                 "order_id": f"DRYRUN-{int(time.time()*1000)}",
                 "exchange": ex_id,
                 "symbol": symbol,
                 "side": side,
                 "status": "filled",
+                "filled": amount,
                 "elapsed_sec": 0.0,
             }
 
         client = self._client(ex_id)
-        self._emit(f"Placing {otype} {side} {amount} {symbol} on {ex_id} (price={price})")
+        self._emit("Placing %s %s %s %s on %s (price=%s)", otype, side, amount, symbol, ex_id, price)
 
         # ---- Place order (ccxt unified) ----
-        order = None
         if otype == "market":
             # ccxt create_order accepts price=None for market orders
-            order = client.create_order(symbol, "market", side, amount, None, {})
+            order_price = None
         else:
             if price is None:
                 raise ValueError("Limit order requires a price.")
-            order = client.create_order(symbol, "limit", side, amount, float(price), {})
+            order_price = float(price)
+        order = self._create_order_bounded(client, symbol, otype, side, amount, order_price)
 
         order_id = order.get("id") if isinstance(order, dict) else getattr(order, "id", None)
-        self._emit(f"Order placed: {order_id}")
+        self._emit("Order placed: %s", order_id)
 
         # ---- Monitor until filled/canceled/stop/timeout ----
         timeout_s = float(
@@ -207,6 +367,7 @@ class TradeExecutor:
         next_sleep = self.min_poll_s
         last_status = None
         status = "unknown"
+        filled = 0.0
 
         # Best-effort: if the exchange doesn't implement fetchOrder, we exit early
         has_fetch_order = getattr(client, "has", {}).get("fetchOrder", True)
@@ -214,7 +375,7 @@ class TradeExecutor:
         while not self.is_stopping():
             elapsed = time.perf_counter() - start
             if elapsed >= timeout_s:
-                self._emit(f"Order timeout after {elapsed:.2f}s: {order_id}")
+                self._emit("Order timeout after %.2fs: %s", elapsed, order_id)
                 status = "timeout"
                 break
 
@@ -222,6 +383,7 @@ class TradeExecutor:
                 if has_fetch_order:
                     info = client.fetch_order(order_id, symbol)
                     status = str(info.get("status", "unknown")).lower()
+                    filled = self._info_filled(info, amount)
                 else:
                     # Fallback: try fetch_open_orders to detect closure
                     open_list = client.fetch_open_orders(symbol=symbol)
@@ -229,12 +391,12 @@ class TradeExecutor:
                     status = "open" if still_open else "closed"
             except Exception as e:
                 # Transient error: log & keep polling
-                self._emit(f"fetch_order transient error: {e}")
+                self._emit("fetch_order transient error: %s", e)
                 status = last_status or "open"
 
             if status != last_status:
                 last_status = status
-                self._emit(f"Order {order_id} status: {status}")
+                self._emit("Order %s status: %s", order_id, status)
 
             if status in ("closed", "filled", "canceled", "rejected"):
                 break
@@ -243,14 +405,18 @@ class TradeExecutor:
             # Adaptive backoff (capped)
             next_sleep = min(self.max_poll_s, max(self.min_poll_s, next_sleep * 1.5))
 
-        # Stop requested: best-effort cancel if not filled yet
-        if self.is_stopping() and status not in ("closed", "filled"):
-            self._emit(f"Cancel due to stop: {order_id}")
-            try:
-                self._cancel_order_ccxt(client, symbol, order_id)
-                status = "canceled"
-            except Exception as e:
-                self.log.warning("Cancel failed for %s: %s", order_id, e)
+        # Stop or timeout: pull the order so it cannot fill after its counterpart is unwound,
+        # then re-read how much went through before the cancel landed.
+        if status not in ("closed", "filled", "canceled", "rejected"):
+            self._emit("Cancel due to %s: %s", "stop" if self.is_stopping() else status, order_id)
+            info = self._cancel_and_read(client, symbol, order_id)
+            if info is not None:
+                final = str(info.get("status", "")).lower()
+                if final in self.FILLED_STATUSES or final == "canceled":
+                    status = final
+                filled = self._info_filled(info, amount)
+        if status in self.FILLED_STATUSES and filled <= 0:
+            filled = amount
 
         elapsed = time.perf_counter() - start
         return {
@@ -259,9 +425,67 @@ class TradeExecutor:
             "symbol": symbol,
             "side": side,
             "status": status,
+            "filled": filled,
             "elapsed_sec": elapsed,
         }
 
+    def _create_order_bounded(self, client: Any, symbol: str, otype: str, side: str, amount: float, price: Optional[float]):
+        """
+        create_order capped at order_timeout_s. A call still queued at the deadline is cancelled
+        outright; one already in flight is handed to _neutralize_late_order once it answers, so
+        an abandoned leg is never left live on the book or as an unhedged fill.
+        """
+        fut = self._order_pool.submit(client.create_order, symbol, otype, side, amount, price, {})
+        try:
+            return fut.result(timeout=self.order_timeout_s)
+        except FuturesTimeout:
+            if not fut.cancel():
+                fut.add_done_callback(lambda f: self._neutralize_late_order(client, symbol, otype, side, amount, f))
+            self._emit("Order placement TIMEOUT after %.1fs: %s %s on %s", self.order_timeout_s, side, symbol, client.id)
+            raise ccxt.RequestTimeout(f"create_order {side} {symbol} on {client.id} exceeded {self.order_timeout_s}s")
+
+    def _neutralize_late_order(self, client: Any, symbol: str, otype: str, side: str, amount: float, fut) -> None:
+        """
+        Done-callback for a placement abandoned by _create_order_bounded. Cancels whatever is
+        still resting and reverses whatever already filled with a market order. Runs on an
+        _order_pool worker, so it calls the client directly instead of going through the pool.
+        """
+        if fut.cancelled() or fut.exception() is not None:
+            return
+        order = fut.result()
+        order_id = order.get("id") if isinstance(order, dict) else getattr(order, "id", None)
+        self.log.critical("Late-acknowledged %s %s %s on %s (order %s): neutralizing", otype, side, symbol, client.id, order_id)
+        if not order_id:
+            return
+        info = self._cancel_and_read(client, symbol, order_id)
+        # Without a readable order, assume a market order filled on arrival.
+        filled = self._info_filled(info, amount) if info is not None else (amount if otype == "market" else 0.0)
+        if filled <= 0:
+            return
+
+        reverse = "sell" if side == "buy" else "buy"
+        try:
+            client.create_order(symbol, "market", reverse, filled, None, {})
+            self.log.critical("Reversed late fill %s: %s %s %s on %s", order_id, reverse, filled, symbol, client.id)
+        except Exception as e:
+            self.log.critical("Reverse of late fill %s FAILED: position left open on %s (%s %s %s): %s",
+                              order_id, client.id, side, filled, symbol, e)
+
+    def _cancel_and_read(self, client: Any, symbol: str, order_id: str) -> Optional[Dict[str, Any]]:
+        """Best-effort cancel, then the order as the exchange now reports it (None if unreadable)."""
+        try:
+            self._cancel_order_ccxt(client, symbol, order_id)
+        except Exception as e:
+            # Already filled orders cannot be cancelled; the re-read below covers them.
+            self.log.warning("Cancel failed for %s: %s", order_id, e)
+        if not getattr(client, "has", {}).get("fetchOrder", True):
+            return None
+        try:
+            return client.fetch_order(order_id, symbol)
+        except Exception as e:
+            self.log.warning("fetch_order after cancel failed for %s: %s", order_id, e)
+            return None
+
     def _cancel_order_ccxt(self, client: Any, symbol: str, order_id: str) -> None:
         if getattr(client, "has", {}).get("cancelOrder", True):
             client.cancel_order(order_id, symbol)
@@ -283,7 +507,12 @@ class TradeExecutor:
         expected = float(getattr(opportunity, "expected_profit", getattr(opportunity, "profit", 0.0)))
         return expected
 
-    def _emit(self, msg: str) -> None:
+    def _emit(self, msg: str, *args: Any) -> None:
+        """%-formats msg lazily: nothing is rendered when there is no callback and INFO is off."""
+        if not self._progress_cb and not self.log.isEnabledFor(logging.INFO):
+            return
+        if args:
+            msg = msg % args
         if self._progress_cb:
             try:
                 self._progress_cb(msg)
@@ -1,11 +1,17 @@
 # utils.py
 
 import os
+import json
 import yaml
 import ccxt
 import logging
 from logging import getLogger
 
+try:  # libyaml C bindings when PyYAML was built with them
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 # --- Custom Exceptions ---
 class ConfigError(Exception):
     """Custom exception for configuration file errors."""
@@ -50,15 +56,70 @@ def validate_config(config):
             
     return True
 
+def _config_source_key(filepath: str):
+    """Identity of the YAML file the sidecar was built from: [st_mtime_ns, st_size]."""
+    st = os.stat(filepath)
+    return [st.st_mtime_ns, st.st_size]
+
+def _read_config_cache(cache_path: str, source_key):
+    """
+    Returns the cached config if the sidecar was built from exactly this YAML file, else None.
+    Keyed on equality, not "newer than", so an older config.yaml restored over a newer one
+    (cp -p, git checkout, backups) still invalidates the cache.
+    """
+    try:
+        with open(cache_path, 'rb') as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(cached, dict) or cached.get("source") != source_key:
+        return None
+    return cached.get("config")
+
+def _write_config_cache(cache_path: str, source_key, config) -> None:
+    """
+    Atomically writes the JSON sidecar; a failed write only costs the next launch a YAML parse.
+    Configs JSON cannot represent exactly (non-string keys, dates, tuples) are not cached, so
+    a cached launch always sees the same config as a parsed one.
+    """
+    try:
+        payload = json.dumps({"source": source_key, "config": config})
+    except (TypeError, ValueError) as e:
+        getLogger(__name__).debug(f"Config not cacheable as JSON: {e}")
+        return
+    if json.loads(payload)["config"] != config:
+        getLogger(__name__).debug("Config does not round-trip through JSON; not caching it.")
+        return
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(payload)
+        os.replace(tmp_path, cache_path)
+        getLogger(__name__).info(f"Regenerated config cache '{cache_path}'.")
+    except OSError as e:
+        getLogger(__name__).debug(f"Could not write config cache '{cache_path}': {e}")
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
 def load_config(filepath: str = None):
     if filepath is None:
         base_dir = os.path.dirname(os.path.dirname(__file__))  # project root
         filepath = os.path.join(base_dir, "config", "config.yaml")
-    """Loads and validates the configuration file."""
+    """Loads and validates the configuration file (via a JSON sidecar cache when it is fresh)."""
+    cache_path = f"{filepath}.json"
     try:
-        with open(filepath, 'r') as f:
-            config = yaml.safe_load(f)
+        # Taken before the read: if the file changes mid-parse, the stored key is already stale.
+        source_key = _config_source_key(filepath)
+        config = _read_config_cache(cache_path, source_key)
+        if config is not None:
+            validate_config(config)
+            return config
+        with open(filepath, 'rb') as f:
+            config = yaml.load(f, Loader=_YamlLoader)
         validate_config(config)
+        _write_config_cache(cache_path, source_key, config)
         return config
     except FileNotFoundError:
         raise ConfigError(f"CRITICAL ERROR: Configuration file '{filepath}' not found.")
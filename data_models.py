@@ -1,6 +1,11 @@
 #data_models.py
 
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, field
+from operator import attrgetter
+from typing import Dict, Tuple
+
+# "BASE/QUOTE" -> (base, quote); the scanner only ever sees a handful of symbols.
+_SYMBOL_CACHE: Dict[str, Tuple[str, str]] = {}
 
 @dataclass
 class Opportunity:
@@ -12,8 +17,38 @@ class Opportunity:
     sell_price: float
     amount: float
     net_profit_usd: float
+    # Split from symbol once at construction ("BTC/USDT" -> "BTC", "USDT").
+    base: str = field(init=False, repr=False)
+    quote: str = field(init=False, repr=False)
+    # Display forms of the exchange ids for log/warning lines.
+    buy_exchange_upper: str = field(init=False, repr=False)
+    sell_exchange_upper: str = field(init=False, repr=False)
+
+    def __post_init__(self):
+        pair = _SYMBOL_CACHE.get(self.symbol)
+        if pair is None:
+            base, _, quote = self.symbol.partition("/")
+            pair = _SYMBOL_CACHE[self.symbol] = (base, quote)
+        self.base, self.quote = pair
+        self.buy_exchange_upper = self.buy_exchange.upper()
+        self.sell_exchange_upper = self.sell_exchange.upper()
 
 @dataclass
+class PortfolioSnapshot:
+    """Portfolio value as of one refresh, shared by the deployment and kill-switch checks."""
+    total_usd: float
+    deployed_usd: float
+    monotonic_ts: float
+
+# Column order of trades.csv.
+TRADE_LOG_COLUMNS = (
+    'session_id', 'timestamp', 'symbol', 'buy_exchange', 'sell_exchange', 'buy_price',
+    'sell_price', 'amount', 'net_profit_usd', 'running_profit_usd',
+    'latency_ms', 'fees_paid', 'fill_ratio', 'status'
+)
+_trade_log_row = attrgetter(*TRADE_LOG_COLUMNS)
+
+@dataclass(slots=True)
 class TradeLogData:
     """A dataclass for structured trade log entries."""
     session_id: str
@@ -32,4 +67,8 @@ class TradeLogData:
     running_profit_usd: float = 0.0
 
     def to_dict(self):
-        return asdict(self)
\ No newline at end of file
+        return asdict(self)
+
+    def to_row(self) -> tuple:
+        """Field values in TRADE_LOG_COLUMNS (trades.csv) order."""
+        return _trade_log_row(self)
\ No newline at end of file
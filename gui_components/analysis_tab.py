@@ -20,6 +20,14 @@ class AnalysisTab(ctk.CTkFrame):
         self.kpi_labels: Dict[str, ctk.CTkLabel] = {}
         self.portfolio_labels: Dict[str, ctk.CTkLabel] = {}
         self.analysis_canvas_widgets: Dict[str, Any] = {}
+        # chart name -> (cached axes background, (xlim, ylim) it was captured at)
+        self._chart_backgrounds: Dict[str, tuple] = {}
+        # One analyzer for the tab's lifetime so its per-load KPI/chart caches survive refreshes.
+        self.analyzer = PerformanceAnalyzer()
+        self._last_label_state: Dict[str, tuple] = {}
+        self._asset_rows: Dict[str, tuple] = {}
+        self._font_bold = ctk.CTkFont(weight="bold")
+        self._font_h2 = ctk.CTkFont(size=12, weight="bold")
         
         self.grid_columnconfigure(1, weight=1)
         self.grid_rowconfigure(1, weight=1)
@@ -62,38 +70,37 @@ class AnalysisTab(ctk.CTkFrame):
     def _create_kpi_frame(self, parent):
         kpi_frame = ctk.CTkFrame(parent)
         kpi_frame.pack(fill="x", expand=True, padx=5, pady=5)
-        ctk.CTkLabel(kpi_frame, text="Trade Performance KPIs", font=ctk.CTkFont(weight="bold")).pack(anchor="w", padx=10, pady=5)
+        kpi_frame.grid_columnconfigure(1, weight=1)
+        ctk.CTkLabel(kpi_frame, text="Trade Performance KPIs", font=self._font_bold).grid(row=0, column=0, columnspan=2, sticky="w", padx=10, pady=5)
         kpi_list = ["Total Trades", "Successful Trades", "Win Rate (%)", "Net P/L ($)", "Profit Factor", "Max Drawdown ($)", "Sharpe Ratio"]
-        for kpi_name in kpi_list:
-            frame = ctk.CTkFrame(kpi_frame, fg_color="transparent")
-            frame.pack(fill="x", padx=10, pady=5)
-            ctk.CTkLabel(frame, text=f"{kpi_name}:", anchor="w").pack(side="left")
-            value_label = ctk.CTkLabel(frame, text="N/A", anchor="e")
-            value_label.pack(side="right")
-            self.kpi_labels[kpi_name] = value_label
+        for row, kpi_name in enumerate(kpi_list, start=1):
+            self.kpi_labels[kpi_name] = self._create_stat_row(kpi_frame, row, kpi_name, "N/A")
+
+    def _create_stat_row(self, parent, row: int, title: str, default: str) -> ctk.CTkLabel:
+        """Grids a title/value label pair straight into parent and returns the value label."""
+        ctk.CTkLabel(parent, text=f"{title}:", anchor="w").grid(row=row, column=0, sticky="w", padx=10, pady=5)
+        value_label = ctk.CTkLabel(parent, text=default, anchor="e")
+        value_label.grid(row=row, column=1, sticky="e", padx=10, pady=5)
+        return value_label
 
     def _create_portfolio_frame(self, parent):
         portfolio_frame = ctk.CTkFrame(parent)
         portfolio_frame.pack(fill="x", expand=True, padx=5, pady=15)
-        ctk.CTkLabel(portfolio_frame, text="Portfolio Performance", font=ctk.CTkFont(weight="bold")).pack(anchor="w", padx=10, pady=5)
+        portfolio_frame.grid_columnconfigure(1, weight=1)
+        ctk.CTkLabel(portfolio_frame, text="Portfolio Performance", font=self._font_bold).grid(row=0, column=0, columnspan=2, sticky="w", padx=10, pady=5)
         portfolio_list = {"Starting Value ($)": "N/A", "Current Value ($)": "N/A", "Portfolio P/L ($)": "N/A", "Portfolio Growth (%)": "N/A"}
-        for name, default_val in portfolio_list.items():
-            frame = ctk.CTkFrame(portfolio_frame, fg_color="transparent")
-            frame.pack(fill="x", padx=10, pady=5)
-            ctk.CTkLabel(frame, text=f"{name}:", anchor="w").pack(side="left")
-            value_label = ctk.CTkLabel(frame, text=default_val, anchor="e")
-            value_label.pack(side="right")
-            self.portfolio_labels[name] = value_label
-        
+        for row, (name, default_val) in enumerate(portfolio_list.items(), start=1):
+            self.portfolio_labels[name] = self._create_stat_row(portfolio_frame, row, name, default_val)
+
         self.portfolio_asset_breakdown_frame = ctk.CTkFrame(portfolio_frame)
-        self.portfolio_asset_breakdown_frame.pack(fill="x", expand=True, padx=10, pady=10)
-        ctk.CTkLabel(self.portfolio_asset_breakdown_frame, text="Asset Breakdown:", font=ctk.CTkFont(size=12, weight="bold")).pack(anchor="w")
+        self.portfolio_asset_breakdown_frame.grid(row=len(portfolio_list) + 1, column=0, columnspan=2, sticky="ew", padx=10, pady=10)
+        ctk.CTkLabel(self.portfolio_asset_breakdown_frame, text="Asset Breakdown:", font=self._font_h2).pack(anchor="w")
 
     def _on_refresh_analysis_data(self):
         """Loads and analyzes trade data, then updates all relevant widgets."""
         self.analysis_status_label.configure(text="Loading and analyzing trade data...")
-        analyzer = PerformanceAnalyzer()
-        
+        analyzer = self.analyzer
+
         if not analyzer.load_data():
             self.analysis_status_label.configure(text="Could not load trades.csv. Run bot to generate data.", text_color="orange")
             return
@@ -101,31 +108,73 @@ class AnalysisTab(ctk.CTkFrame):
         kpis = analyzer.calculate_kpis()
         for name, label in self.kpi_labels.items():
             value = kpis.get(name, "N/A")
-            label.configure(text=str(value))
+            text_color = None
             if name == "Net P/L ($)":
                 try:
                     profit_val = float(str(value).replace("$","").replace(",",""))
-                    label.configure(text_color="green" if profit_val >= 0 else "red")
+                    text_color = "green" if profit_val >= 0 else "red"
                 except (ValueError, TypeError):
-                    label.configure(text_color="gray")
+                    text_color = "gray"
+            self._set_label(f"kpi:{name}", label, str(value), text_color)
         
-        self._embed_chart(analyzer.generate_equity_curve(), "P/L Curve")
+        self._embed_chart(analyzer.generate_equity_curve(), "P/L Curve", animated=analyzer.equity_line)
         self._embed_chart(analyzer.generate_profit_by_symbol_chart(), "Profit By Symbol")
         self._populate_trade_log_table(analyzer.trades_df)
         self.analysis_status_label.configure(text="Analysis complete.", text_color="green")
 
-    def _embed_chart(self, fig: Figure, chart_name: str):
-        """Destroys old chart and embeds a new one in its place."""
-        if chart_name in self.analysis_canvas_widgets and self.analysis_canvas_widgets[chart_name]:
-            self.analysis_canvas_widgets[chart_name].get_tk_widget().destroy()
+    def _set_label(self, key: str, label: ctk.CTkLabel, text: str, text_color: Optional[str] = None):
+        """Configures the label only if its text or color differs from the last render."""
+        state = (text, text_color)
+        if self._last_label_state.get(key) == state:
+            return
+        self._last_label_state[key] = state
+        if text_color is None:
+            label.configure(text=text)
+        else:
+            label.configure(text=text, text_color=text_color)
+
+    def _embed_chart(self, fig: Figure, chart_name: str, animated=None):
+        """
+        Embeds the chart, reusing its canvas when the analyzer hands back the same Figure.
+        With an `animated` artist, a refresh that leaves the axes limits unchanged restores
+        the cached background and blits just that artist instead of redrawing the figure.
+        """
+        canvas = self.analysis_canvas_widgets.get(chart_name)
+        if canvas is not None and canvas.figure is fig:
+            if animated is None or not self._blit_chart(chart_name, canvas, animated):
+                canvas.draw_idle()
+            return
+        if canvas is not None:
+            canvas.get_tk_widget().destroy()
+            self._chart_backgrounds.pop(chart_name, None)
         
         parent_frame = self.chart_frames.get(chart_name)
         if parent_frame:
             canvas = FigureCanvasTkAgg(fig, master=parent_frame)
+            if animated is not None:
+                # Every full draw (first paint, rescale, window resize) re-captures the background.
+                canvas.mpl_connect('draw_event', lambda event: self._capture_chart_background(chart_name, event.canvas, animated))
             canvas_widget = canvas.get_tk_widget()
             canvas_widget.pack(side="top", fill="both", expand=True, padx=5, pady=5)
             canvas.draw()
             self.analysis_canvas_widgets[chart_name] = canvas
+
+    def _capture_chart_background(self, chart_name: str, canvas, artist):
+        """draw_event hook: caches the static axes render, then paints the animated artist on it."""
+        ax = artist.axes
+        self._chart_backgrounds[chart_name] = (canvas.copy_from_bbox(ax.bbox), (ax.get_xlim(), ax.get_ylim()))
+        ax.draw_artist(artist)
+
+    def _blit_chart(self, chart_name: str, canvas, artist) -> bool:
+        """Blits the artist over the cached background; False if the axes limits moved."""
+        ax = artist.axes
+        cached = self._chart_backgrounds.get(chart_name)
+        if cached is None or cached[1] != (ax.get_xlim(), ax.get_ylim()):
+            return False
+        canvas.restore_region(cached[0])
+        ax.draw_artist(artist)
+        canvas.blit(ax.bbox)
+        return True
     
     def _populate_trade_log_table(self, df: pd.DataFrame):
         """Clears and repopulates the trade log with new data."""
@@ -135,7 +184,7 @@ class AnalysisTab(ctk.CTkFrame):
         headers = ['Timestamp', 'Symbol', 'Buy Ex', 'Sell Ex', 'Net Profit ($)']
         self.trade_log_frame.grid_columnconfigure((0,1,2,3,4), weight=1)
         for i, header in enumerate(headers):
-            ctk.CTkLabel(self.trade_log_frame, text=header, font=ctk.CTkFont(weight="bold")).grid(row=0, column=i, padx=5, pady=2)
+            ctk.CTkLabel(self.trade_log_frame, text=header, font=self._font_bold).grid(row=0, column=i, padx=5, pady=2)
         
         df_display = df[df['status'] == 'SUCCESS'].reset_index()
         for index, row in df_display.iterrows():
@@ -157,23 +206,36 @@ class AnalysisTab(ctk.CTkFrame):
         pnl = current_val - start_val
         growth = (pnl / start_val * 100) if start_val > 0 else 0.0
         
-        self.portfolio_labels["Starting Value ($)"].configure(text=f"${start_val:,.2f}")
-        self.portfolio_labels["Current Value ($)"].configure(text=f"${current_val:,.2f}")
-        self.portfolio_labels["Portfolio P/L ($)"].configure(text=f"${pnl:,.2f}", text_color="green" if pnl >= 0 else "red")
-        self.portfolio_labels["Portfolio Growth (%)"].configure(text=f"{growth:.2f}%", text_color="green" if growth >= 0 else "red")
-
-        # --- Update Asset Breakdown ---
-        for widget in self.portfolio_asset_breakdown_frame.winfo_children():
-            if not isinstance(widget, ctk.CTkLabel) or "Asset Breakdown" not in widget.cget("text"):
-                widget.destroy()
+        labels = self.portfolio_labels
+        self._set_label("pf:start", labels["Starting Value ($)"], f"${start_val:,.2f}")
+        self._set_label("pf:current", labels["Current Value ($)"], f"${current_val:,.2f}")
+        self._set_label("pf:pnl", labels["Portfolio P/L ($)"], f"${pnl:,.2f}", "green" if pnl >= 0 else "red")
+        self._set_label("pf:growth", labels["Portfolio Growth (%)"], f"{growth:.2f}%", "green" if growth >= 0 else "red")
 
+        # --- Update Asset Breakdown (diffed per asset row) ---
         all_assets = sorted(list(set(initial_snapshot.get("assets", {}).keys()) | set(current_data.get("assets", {}).keys())))
+        for asset in set(self._asset_rows) - set(all_assets):
+            self._asset_rows.pop(asset)[0].destroy()
+
         for asset in all_assets:
             start_asset = initial_snapshot.get("assets", {}).get(asset, {"balance": 0.0, "value_usd": 0.0})
             current_asset = current_data.get("assets", {}).get(asset, {"balance": 0.0, "value_usd": 0.0})
-            
-            asset_frame = ctk.CTkFrame(self.portfolio_asset_breakdown_frame)
-            asset_frame.pack(fill="x", pady=2)
-            ctk.CTkLabel(asset_frame, text=asset, font=ctk.CTkFont(weight="bold"), width=60).pack(side="left", padx=5)
-            ctk.CTkLabel(asset_frame, text=f"Start: ${start_asset['value_usd']:,.2f} ({start_asset['balance']:.4f})").pack(side="left", padx=10)
-            ctk.CTkLabel(asset_frame, text=f"Now: ${current_asset['value_usd']:,.2f} ({current_asset['balance']:.4f})").pack(side="left", padx=10)
+            start_text = f"Start: ${start_asset['value_usd']:,.2f} ({start_asset['balance']:.4f})"
+            now_text = f"Now: ${current_asset['value_usd']:,.2f} ({current_asset['balance']:.4f})"
+
+            row = self._asset_rows.get(asset)
+            if row is None:
+                asset_frame = ctk.CTkFrame(self.portfolio_asset_breakdown_frame)
+                asset_frame.pack(fill="x", pady=2)
+                ctk.CTkLabel(asset_frame, text=asset, font=self._font_bold, width=60).pack(side="left", padx=5)
+                start_label = ctk.CTkLabel(asset_frame, text=start_text)
+                start_label.pack(side="left", padx=10)
+                now_label = ctk.CTkLabel(asset_frame, text=now_text)
+                now_label.pack(side="left", padx=10)
+                self._asset_rows[asset] = (asset_frame, start_label, now_label)
+                self._last_label_state[f"asset_start:{asset}"] = (start_text, None)
+                self._last_label_state[f"asset_now:{asset}"] = (now_text, None)
+            else:
+                _, start_label, now_label = row
+                self._set_label(f"asset_start:{asset}", start_label, start_text)
+                self._set_label(f"asset_now:{asset}", now_label, now_text)
@@ -1,7 +1,56 @@
+import re
+import threading
+import time
 import customtkinter as ctk
+from array import array
+from functools import lru_cache
+from tkinter import ttk
 from typing import Any, Dict, Callable
 
 
+_NUM_RE = re.compile(r"^\d*\.?\d*$")
+_TWO_DIGITS = tuple(f"{i:02}" for i in range(100))
+
+
+_STYLES_INSTALLED = False
+
+
+def _install_styles(master) -> None:
+    """Configures the process-global ttk styles used by the panel, once."""
+    global _STYLES_INSTALLED
+    if _STYLES_INSTALLED:
+        return
+    style = ttk.Style(master)
+    style.configure(
+        "Symbols.Treeview",
+        background="#2B2B2B",
+        fieldbackground="#2B2B2B",
+        foreground="#DCE4EE",
+        borderwidth=0,
+        rowheight=24,
+    )
+    style.map("Symbols.Treeview", background=[("selected", "#1F6AA5")])
+    _STYLES_INSTALLED = True
+
+
+@lru_cache(maxsize=1024)
+def _fmt_balance(value: float) -> str:
+    return f"{value:.4f}"
+
+
+@lru_cache(maxsize=1024)
+def _fmt_money(value: float) -> str:
+    return f"{value:.2f}"
+
+
+@lru_cache(maxsize=4096)
+def _fmt_hms(total_seconds: int) -> str:
+    hours, remainder = divmod(total_seconds, 3600)
+    minutes, seconds = divmod(remainder, 60)
+    hh = _TWO_DIGITS[hours] if hours < 100 else str(hours)
+    return f"{hh}:{_TWO_DIGITS[minutes]}:{_TWO_DIGITS[seconds]}"
+
+
 class LeftPanel(ctk.CTkFrame):
     """
     The entire left-side panel of the GUI.
@@ -9,6 +58,19 @@ class LeftPanel(ctk.CTkFrame):
     and displays for session stats and wallet balances.
     """
 
+    # Cadence of the Tk-side tick that renders the latest stats, balances and
+    # runtime clock. Override with config["ui"]["refresh_interval_ms"].
+    REFRESH_INTERVAL_MS = 1000
+
+    STATS_KEYS = (
+        "Session Profit (USDT):",
+        "Trades:",
+        "Win Rate:",
+        "Avg Profit/Trade:",
+        "Failed Trades:",
+        "Neutralized Trades:",
+    )
+
     def __init__(self, master, config: Dict[str, Any], start_callback: Callable, stop_callback: Callable):
         super().__init__(master, width=350, corner_radius=0)
         self.config = config
@@ -18,9 +80,56 @@ class LeftPanel(ctk.CTkFrame):
         self.grid_propagate(False)
         self.grid_rowconfigure(4, weight=1)
 
-        self.symbol_checkboxes: Dict[str, ctk.CTkCheckBox] = {}
+        self.symbol_tree: ttk.Treeview | None = None
+        self.symbol_names: list[str] = []
+        self.symbol_flags = array("b")
+        self._symbol_index: Dict[str, int] = {}
+        self._selected_symbols: set[str] = set()
+        self._last_stats: Dict[str, str] = {}
+        self._controls_enabled = True
+        self._status_state: tuple[str, str] = ("STOPPED", "red")
+        self._queue_lock = threading.Lock()
+        self._latest_stats: Dict[str, Any] | None = None
+        self._latest_balances: Dict[str, Any] | None = None
+        self._runtime_origin: float | None = None
+        self._refresh_interval_ms = int(
+            self.config.get("ui", {}).get("refresh_interval_ms", self.REFRESH_INTERVAL_MS)
+        )
+        self._stat_vars: Dict[str, ctk.StringVar] = {}
+        self._parsed: Dict[str, tuple[float | None, str | None]] = {}
+        self._label_pool: list[ctk.CTkLabel] = []
+        self._balance_struct_hash: int | None = None
+        self._last_balance_fp: int | None = None
+        self._ex_cache_key: frozenset | None = None
+        self._sorted_exchanges: list[str] = []
+        self._asset_cache_key: frozenset | None = None
+        self._sorted_assets: list[str] = []
+        self._balance_exchanges: list[str] = []
+        self._balance_assets: list[str] = []
+        self._balance_corner: ctk.CTkLabel | None = None
+        self._balance_headers: Dict[str, ctk.CTkLabel] = {}
+        self._balance_asset_labels: Dict[str, ctk.CTkLabel] = {}
+        self._balance_cells: Dict[tuple[str, str], ctk.CTkLabel] = {}
+        self._balance_cell_text: Dict[tuple[str, str], str] = {}
+        self._balance_positions: Dict[ctk.CTkLabel, tuple[int, int]] = {}
+        self._balance_num_cols = 0
+        self._last_uptime_seconds = -1
+        self.balance_frame: ctk.CTkScrollableFrame | None = None
+        self._pending_balances: Dict[str, Any] | None = None
+        self._runtime_text = "0"
+
+        # Tcl validation command shared by every numeric entry; registered once per panel.
+        self._numeric_vcmd = self.register(lambda proposed: _NUM_RE.match(proposed) is not None)
+
+        # Shared fonts: each CTkFont is a Tk font resource that has to be measured.
+        self._font_default = ctk.CTkFont()
+        self._font_title = ctk.CTkFont(size=20, weight="bold")
+        self._font_bold = ctk.CTkFont(weight="bold")
+        self._font_small = ctk.CTkFont(size=11)
+        self._font_status_bold = self._font_bold
+        self._font_status_normal = self._font_default
         self.create_widgets()
-        self.pack(expand=True, fill="both")
+        self.after(self._refresh_interval_ms, self._slow_tick)
 
     # ----------------------------------------------------------------------
     # UI CREATION
@@ -28,7 +137,7 @@ class LeftPanel(ctk.CTkFrame):
     def create_widgets(self):
         """Builds all widgets within the left panel."""
         ctk.CTkLabel(
-            self, text="Arbitrage Bot", font=ctk.CTkFont(size=20, weight="bold")
+            self, text="Arbitrage Bot", font=self._font_title
         ).grid(row=0, column=0, padx=20, pady=(20, 10))
 
         # --- Control Frame ---
@@ -45,7 +154,7 @@ class LeftPanel(ctk.CTkFrame):
         sizing_frame.grid_columnconfigure(0, weight=1)
 
         ctk.CTkLabel(
-            sizing_frame, text="Sizing Mode", font=ctk.CTkFont(weight="bold")
+            sizing_frame, text="Sizing Mode", font=self._font_bold
         ).grid(row=0, column=0, columnspan=2, pady=(5, 0))
 
         self.sizing_mode_var = ctk.StringVar(
@@ -73,34 +182,46 @@ class LeftPanel(ctk.CTkFrame):
         # Fixed Sizing
         self.fixed_sizing_frame = ctk.CTkFrame(sizing_frame)
         self.fixed_sizing_frame.grid_columnconfigure(1, weight=1)
-        ctk.CTkLabel(self.fixed_sizing_frame, text="Size (USDT):").grid(
+        ctk.CTkLabel(self.fixed_sizing_frame, text="Size (USDT):", font=self._font_default).grid(
             row=0, column=0, padx=10, pady=5, sticky="w"
         )
-        self.trade_size_entry = ctk.CTkEntry(self.fixed_sizing_frame)
+        self.trade_size_var = ctk.StringVar(
+            value=str(self.config["trading_parameters"].get("trade_size_usdt", 20.0))
+        )
+        self.trade_size_entry = ctk.CTkEntry(self.fixed_sizing_frame, textvariable=self.trade_size_var)
         self.trade_size_entry.grid(row=0, column=1, padx=10, pady=5, sticky="ew")
-        self.trade_size_entry.insert(
-            0, str(self.config["trading_parameters"].get("trade_size_usdt", 20.0))
+        self._watch_numeric(
+            self.trade_size_var, self.trade_size_entry, "trade_size_usdt",
+            lambda v: v > 0, "Fixed trade size must be positive.",
         )
 
         # Dynamic Sizing
         self.dynamic_sizing_frame = ctk.CTkFrame(sizing_frame)
         self.dynamic_sizing_frame.grid_columnconfigure(1, weight=1)
-        ctk.CTkLabel(self.dynamic_sizing_frame, text="Balance (%):").grid(
+        ctk.CTkLabel(self.dynamic_sizing_frame, text="Balance (%):", font=self._font_default).grid(
             row=0, column=0, padx=10, pady=5, sticky="w"
         )
-        self.dynamic_pct_entry = ctk.CTkEntry(self.dynamic_sizing_frame)
+        self.dynamic_pct_var = ctk.StringVar(
+            value=str(self.config["trading_parameters"].get("dynamic_size_percentage", 5.0))
+        )
+        self.dynamic_pct_entry = ctk.CTkEntry(self.dynamic_sizing_frame, textvariable=self.dynamic_pct_var)
         self.dynamic_pct_entry.grid(row=0, column=1, padx=10, pady=5, sticky="ew")
-        self.dynamic_pct_entry.insert(
-            0, str(self.config["trading_parameters"].get("dynamic_size_percentage", 5.0))
+        self._watch_numeric(
+            self.dynamic_pct_var, self.dynamic_pct_entry, "dynamic_size_percentage",
+            lambda v: 0 < v <= 100, "Percentage must be between 0 and 100.",
         )
 
-        ctk.CTkLabel(self.dynamic_sizing_frame, text="Max Size (USDT):").grid(
+        ctk.CTkLabel(self.dynamic_sizing_frame, text="Max Size (USDT):", font=self._font_default).grid(
             row=1, column=0, padx=10, pady=5, sticky="w"
         )
-        self.dynamic_max_entry = ctk.CTkEntry(self.dynamic_sizing_frame)
+        self.dynamic_max_var = ctk.StringVar(
+            value=str(self.config["trading_parameters"].get("dynamic_size_max_usdt", 100.0))
+        )
+        self.dynamic_max_entry = ctk.CTkEntry(self.dynamic_sizing_frame, textvariable=self.dynamic_max_var)
         self.dynamic_max_entry.grid(row=1, column=1, padx=10, pady=5, sticky="ew")
-        self.dynamic_max_entry.insert(
-            0, str(self.config["trading_parameters"].get("dynamic_size_max_usdt", 100.0))
+        self._watch_numeric(
+            self.dynamic_max_var, self.dynamic_max_entry, "dynamic_size_max_usdt",
+            lambda v: v > 0, "Max size must be positive.",
         )
 
         self.dry_run_checkbox = ctk.CTkCheckBox(sizing_frame, text="Dry Run (Simulation Mode)")
@@ -113,35 +234,67 @@ class LeftPanel(ctk.CTkFrame):
         # --- Symbol Selection Frame ---
         symbol_frame = ctk.CTkFrame(self)
         symbol_frame.grid(row=3, column=0, padx=20, pady=10, sticky="ew")
-        ctk.CTkLabel(symbol_frame, text="Symbol Selection", font=ctk.CTkFont(weight="bold")).pack(
+        ctk.CTkLabel(symbol_frame, text="Symbol Selection", font=self._font_bold).pack(
             anchor="w", padx=10, pady=(5, 0)
         )
 
-        symbol_scroll_frame = ctk.CTkScrollableFrame(symbol_frame, height=150)
-        symbol_scroll_frame.pack(fill="x", expand=True, padx=5, pady=5)
-
-        for symbol in self.config["trading_parameters"]["symbols_to_scan"]:
-            checkbox = ctk.CTkCheckBox(symbol_scroll_frame, text=symbol)
-            checkbox.pack(anchor="w", padx=10, pady=2)
+        # One native Treeview instead of a canvas-backed CTkCheckBox per symbol.
+        _install_styles(self)
+
+        # Treeview only draws the rows inside its viewport, so the visible height
+        # stays bounded no matter how many symbols are configured.
+        symbols = self.config["trading_parameters"]["symbols_to_scan"]
+        tree_frame = ctk.CTkFrame(symbol_frame, fg_color="transparent")
+        tree_frame.pack(fill="x", expand=True, padx=5, pady=5)
+        self.symbol_tree = ttk.Treeview(
+            tree_frame,
+            show="tree",
+            selectmode="extended",
+            style="Symbols.Treeview",
+            height=max(1, min(len(symbols), 6)),
+        )
+        symbol_scrollbar = ctk.CTkScrollbar(tree_frame, command=self.symbol_tree.yview)
+        self.symbol_tree.configure(yscrollcommand=symbol_scrollbar.set)
+        symbol_scrollbar.pack(side="right", fill="y")
+        self.symbol_tree.pack(side="left", fill="x", expand=True)
+
+        self.symbol_names = list(symbols)
+        self.symbol_flags = array("b", [0] * len(self.symbol_names))
+        self._symbol_index = {name: i for i, name in enumerate(self.symbol_names)}
+        for symbol in self.symbol_names:
             # ✅ Start deselected
-            checkbox.deselect()
-            self.symbol_checkboxes[symbol] = checkbox
+            self.symbol_tree.insert("", "end", iid=symbol, text=symbol)
+        self.symbol_tree.bind("<<TreeviewSelect>>", self._on_symbol_select)
 
         # --- Tabs (Stats + Wallet) ---
-        left_tab_view = ctk.CTkTabview(self)
-        left_tab_view.grid(row=4, column=0, padx=20, pady=10, sticky="nsew")
-        left_tab_view.add("Session Stats")
-        left_tab_view.add("Wallet Balances")
+        self.left_tab_view = ctk.CTkTabview(self, command=self._on_tab_changed)
+        self.left_tab_view.grid(row=4, column=0, padx=20, pady=10, sticky="nsew")
+        self.left_tab_view.add("Session Stats")
+        self.left_tab_view.add("Wallet Balances")
 
         # Stats Tab
-        stats_tab = left_tab_view.tab("Session Stats")
+        stats_tab = self.left_tab_view.tab("Session Stats")
         self.stats_frame = ctk.CTkFrame(stats_tab, fg_color="transparent")
         self.stats_frame.pack(fill="both", expand=True, padx=5, pady=5)
         self.stats_frame.grid_columnconfigure(1, weight=1)
         self._create_stats_labels()
 
-        # Balances Tab
-        balances_tab = left_tab_view.tab("Wallet Balances")
+        # Balances Tab is built on first open (see _on_tab_changed); Session Stats
+        # is the initially visible tab.
+
+    def _on_tab_changed(self):
+        if self.left_tab_view.get() != "Wallet Balances":
+            return
+        self._ensure_balance_frame()
+        if self._pending_balances is not None:
+            pending, self._pending_balances = self._pending_balances, None
+            self.update_balance_display(pending)
+
+    def _ensure_balance_frame(self):
+        """Creates the wallet grid container on first view."""
+        if self.balance_frame is not None:
+            return
+        balances_tab = self.left_tab_view.tab("Wallet Balances")
         balances_tab.grid_columnconfigure(0, weight=1)
         balances_tab.grid_rowconfigure(0, weight=1)
         self.balance_frame = ctk.CTkScrollableFrame(balances_tab, label_text="")
@@ -156,26 +309,34 @@ class LeftPanel(ctk.CTkFrame):
             self.stats_frame,
             text="Status: STOPPED",
             text_color="red",
-            font=ctk.CTkFont(weight="bold"),
+            font=self._font_status_bold,
         )
         self.status_label.grid(row=0, column=0, columnspan=2, padx=10, pady=(5, 10))
 
+        # The static part of the table is one multi-line key label and one
+        # multi-line value label, so a stats tick is a single StringVar write.
+        self.stats_keys_label = ctk.CTkLabel(
+            self.stats_frame, text="\n".join(self.STATS_KEYS), font=self._font_default, justify="left", anchor="nw"
+        )
+        self.stats_keys_label.grid(row=1, column=0, padx=10, pady=5, sticky="nw")
+        self._stat_vars["stats_values"] = ctk.StringVar(value="\n".join(("0", "0", "–", "0", "0", "0")))
+        self.stats_values_label = ctk.CTkLabel(
+            self.stats_frame, textvariable=self._stat_vars["stats_values"], font=self._font_default,
+            justify="right", anchor="ne",
+        )
+        self.stats_values_label.grid(row=1, column=1, padx=10, pady=5, sticky="ne")
+
         label_style = dict(padx=10, pady=5, sticky="w")
         value_style = dict(padx=10, pady=5, sticky="e")
 
-        self._add_stat("Session Profit (USDT):", "session_profit_label", 1, label_style, value_style)
-        self._add_stat("Trades:", "trade_count_label", 2, label_style, value_style)
-        self._add_stat("Win Rate:", "win_rate_label", 3, label_style, value_style, "–")
-        self._add_stat("Avg Profit/Trade:", "avg_profit_label", 4, label_style, value_style)
-        self._add_stat("Failed Trades:", "failed_trades_label", 5, label_style, value_style)
-        self._add_stat("Neutralized Trades:", "neutral_trades_label", 6, label_style, value_style)
-        self._add_stat("Critical Failures:", "critical_failures_label", 7, label_style, value_style, text_color="red")
-        self._add_stat("Runtime:", "runtime_label", 8, label_style, value_style)
+        self._add_stat("Critical Failures:", "critical_failures", 2, label_style, value_style, text_color="red")
+        self._add_stat("Runtime:", "runtime", 3, label_style, value_style)
 
-    def _add_stat(self, text: str, attr_name: str, row: int, label_style: dict, value_style: dict, default: str = "0", text_color=None):
-        ctk.CTkLabel(self.stats_frame, text=text, text_color=text_color).grid(row=row, column=0, **label_style)
-        setattr(self, attr_name, ctk.CTkLabel(self.stats_frame, text=default))
-        getattr(self, attr_name).grid(row=row, column=1, **value_style)
+    def _add_stat(self, text: str, key: str, row: int, label_style: dict, value_style: dict, default: str = "0", text_color=None):
+        ctk.CTkLabel(self.stats_frame, text=text, text_color=text_color, font=self._font_default).grid(row=row, column=0, **label_style)
+        self._stat_vars[key] = ctk.StringVar(value=default)
+        setattr(self, f"{key}_label", ctk.CTkLabel(self.stats_frame, textvariable=self._stat_vars[key], font=self._font_default))
+        getattr(self, f"{key}_label").grid(row=row, column=1, **value_style)
 
     # ----------------------------------------------------------------------
     # CONTROL & UPDATE METHODS
@@ -190,28 +351,55 @@ class LeftPanel(ctk.CTkFrame):
             self.fixed_sizing_frame.grid_remove()
             self.dynamic_sizing_frame.grid(row=2, column=0, columnspan=2, sticky="ew", padx=5, pady=5)
 
+    def _on_symbol_select(self, _event=None):
+        """Mirrors the tree selection into the flag array, touching only changed symbols."""
+        selected = set(self.symbol_tree.selection())
+        flags = self.symbol_flags
+        index = self._symbol_index
+        for name in self._selected_symbols - selected:
+            flags[index[name]] = 0
+        for name in selected - self._selected_symbols:
+            flags[index[name]] = 1
+        self._selected_symbols = selected
+
+    def _watch_numeric(self, var: ctk.StringVar, entry: ctk.CTkEntry, key: str, check: Callable[[float], bool], error: str):
+        """Parses and validates an entry on every keystroke into self._parsed."""
+        # Reject non-numeric keystrokes outright; the trace below only has to
+        # deal with the partial states ("", ".") and range checks.
+        entry.configure(validate="key", validatecommand=(self._numeric_vcmd, "%P"))
+        default_border = ctk.ThemeManager.theme["CTkEntry"]["border_color"]
+
+        def _validate(*_):
+            try:
+                value = float(var.get())
+            except ValueError as e:
+                self._parsed[key] = (None, str(e))
+            else:
+                self._parsed[key] = (value, None) if check(value) else (None, error)
+            entry.configure(border_color=default_border if self._parsed[key][1] is None else "red")
+
+        var.trace_add("write", _validate)
+        _validate()
+
+    def _parsed_value(self, key: str) -> float:
+        value, error = self._parsed[key]
+        if error is not None:
+            raise ValueError(error)
+        return value
+
     def get_start_parameters(self) -> Dict[str, Any]:
         """Collects all parameters from user inputs before bot start."""
         sizing_mode = self.sizing_mode_var.get()
         params = {"sizing_mode": sizing_mode}
 
         if sizing_mode == "fixed":
-            trade_size = float(self.trade_size_entry.get())
-            if trade_size <= 0:
-                raise ValueError("Fixed trade size must be positive.")
-            params["trade_size_usdt"] = trade_size
+            params["trade_size_usdt"] = self._parsed_value("trade_size_usdt")
         else:
-            pct = float(self.dynamic_pct_entry.get())
-            max_size = float(self.dynamic_max_entry.get())
-            if not (0 < pct <= 100):
-                raise ValueError("Percentage must be between 0 and 100.")
-            if max_size <= 0:
-                raise ValueError("Max size must be positive.")
-            params["dynamic_size_percentage"] = pct
-            params["dynamic_size_max_usdt"] = max_size
+            params["dynamic_size_percentage"] = self._parsed_value("dynamic_size_percentage")
+            params["dynamic_size_max_usdt"] = self._parsed_value("dynamic_size_max_usdt")
 
         params["dry_run"] = self.dry_run_checkbox.get() == 1
-        selected_symbols = [s for s, c in self.symbol_checkboxes.items() if c.get() == 1]
+        selected_symbols = [name for name, flag in zip(self.symbol_names, self.symbol_flags) if flag]
         if not selected_symbols:
             raise ValueError("Please select at least one symbol to trade.")
         params["selected_symbols"] = selected_symbols
@@ -219,6 +407,9 @@ class LeftPanel(ctk.CTkFrame):
 
     def set_controls_state(self, is_enabled: bool):
         """Enable or disable all input controls."""
+        if is_enabled == self._controls_enabled:
+            return
+        self._controls_enabled = is_enabled
         state = "normal" if is_enabled else "disabled"
         self.start_button.configure(state="normal" if is_enabled else "disabled")
         self.stop_button.configure(state="disabled" if is_enabled else "normal")
@@ -226,16 +417,58 @@ class LeftPanel(ctk.CTkFrame):
         for w in [self.fixed_radio, self.dynamic_radio, self.trade_size_entry, self.dynamic_pct_entry, self.dynamic_max_entry, self.dry_run_checkbox]:
             w.configure(state=state)
 
-        for checkbox in self.symbol_checkboxes.values():
-            checkbox.configure(state=state)
+        self.symbol_tree.configure(selectmode="extended" if is_enabled else "none")
 
         if is_enabled:
             self.set_status("STOPPED", "red")
 
     def set_status(self, text: str, color: str):
         """Set the engine status label color and text."""
-        self.status_label.configure(text=f"Status: {text}", text_color=color)
-        self.status_label.configure(font=ctk.CTkFont(weight="bold" if text == "RUNNING" else "normal"))
+        if self._status_state == (text, color):
+            return
+        self._status_state = (text, color)
+        self.status_label.configure(
+            text=f"Status: {text}",
+            text_color=color,
+            font=self._font_status_bold if text == "RUNNING" else self._font_status_normal,
+        )
+
+    def _set_text(self, key: str, text: str):
+        """Writes the stat's StringVar only when its text actually changed."""
+        if self._last_stats.get(key) == text:
+            return
+        self._last_stats[key] = text
+        self._stat_vars[key].set(text)
+
+    # ----------------------------------------------------------------------
+    # THREAD-SAFE ENTRY POINTS
+    # ----------------------------------------------------------------------
+    def queue_stats(self, stats: Dict[str, Any]):
+        """Stores the latest stats from a worker thread; rendered on the next tick."""
+        with self._queue_lock:
+            self._latest_stats = stats
+
+    def queue_balances(self, balance_data: Dict[str, Any]):
+        """Stores the latest balances from a worker thread; rendered on the next tick."""
+        with self._queue_lock:
+            self._latest_balances = balance_data
+
+    def set_runtime_origin(self, start_time: float | None):
+        """Sets the wall-clock start the runtime clock counts from; None stops it."""
+        self._runtime_origin = start_time
+
+    def _slow_tick(self):
+        """Renders the latest stats, balances and runtime clock, at most once per interval."""
+        with self._queue_lock:
+            stats, self._latest_stats = self._latest_stats, None
+            balances, self._latest_balances = self._latest_balances, None
+        if stats is not None:
+            self.update_stats_display(**stats)
+        if balances is not None:
+            self.update_balance_display(balances)
+        if self._runtime_origin is not None:
+            self.update_runtime_clock(int(time.time() - self._runtime_origin))
+        self.after(self._refresh_interval_ms, self._slow_tick)
 
     def update_stats_display(
         self,
@@ -249,60 +482,144 @@ class LeftPanel(ctk.CTkFrame):
     ):
         """Updates the statistics labels on the panel."""
         try:
-            self.session_profit_label.configure(text=f"{session_profit:.2f}")
-            self.trade_count_label.configure(text=str(trade_count))
-            self.win_rate_label.configure(text=f"{win_rate:.1f} %" if win_rate is not None else "–")
-            self.avg_profit_label.configure(text=f"{avg_profit:.2f}")
-            self.failed_trades_label.configure(text=str(failed_trades))
-            self.neutral_trades_label.configure(text=str(neutralized_trades))
-            self.critical_failures_label.configure(text=str(critical_failures))
+            values = "\n".join((
+                _fmt_money(session_profit),
+                str(trade_count),
+                f"{win_rate:.1f} %" if win_rate is not None else "–",
+                _fmt_money(avg_profit),
+                str(failed_trades),
+                str(neutralized_trades),
+            ))
+            self._set_text("stats_values", values)
+            self._set_text("critical_failures", str(critical_failures))
         except Exception as e:
             print(f"[WARN] Stats update failed: {e}")
 
+    def _acquire_balance_label(self, text: str, font: ctk.CTkFont, anchor: str = "center") -> ctk.CTkLabel:
+        """Returns a pooled label (or a new one) configured for a balance cell."""
+        if self._label_pool:
+            label = self._label_pool.pop()
+            label.configure(text=text, font=font, anchor=anchor)
+        else:
+            label = ctk.CTkLabel(self.balance_frame, text=text, font=font, anchor=anchor)
+        return label
+
+    def _release_balance_label(self, label: ctk.CTkLabel):
+        label.grid_forget()
+        self._balance_positions.pop(label, None)
+        self._label_pool.append(label)
+
+    def _place_balance_label(self, label: ctk.CTkLabel, row: int, column: int, sticky: str):
+        """Grids the label only if it is not already at (row, column)."""
+        if self._balance_positions.get(label) != (row, column):
+            self._balance_positions[label] = (row, column)
+            label.grid(row=row, column=column, padx=5, pady=2, sticky=sticky)
+
+    def _refresh_balance_values(self, balance_data: Dict[str, Any]):
+        """Updates value cells in place, touching only the ones whose text changed."""
+        exchange_names = self._balance_exchanges
+        per_ex = [balance_data.get(ex_name) or {} for ex_name in exchange_names]
+        cell_text = self._balance_cell_text
+
+        changed = []
+        for asset in self._balance_assets:
+            for ex_name, ex_balances in zip(exchange_names, per_ex):
+                balance = ex_balances.get(asset, 0.0)
+                text = _fmt_balance(balance if isinstance(balance, (int, float)) else 0.0)
+                key = (asset, ex_name)
+                if cell_text.get(key) != text:
+                    changed.append((key, text))
+
+        cells = self._balance_cells
+        for key, text in changed:
+            cell_text[key] = text
+            cells[key].configure(text=text)
+
     def update_balance_display(self, balance_data: Dict[str, Any]):
         """Refresh wallet balances in grid format."""
-        for widget in self.balance_frame.winfo_children():
-            widget.destroy()
-
-        all_assets = set()
-        exchange_names = sorted(balance_data.keys())
-        for ex_name in exchange_names:
-            all_assets.update(balance_data[ex_name].keys())
-        sorted_assets = sorted(list(all_assets))
-
+        if self.balance_frame is None or self.left_tab_view.get() != "Wallet Balances":
+            # Hidden tab: keep only the latest payload and render it when shown.
+            self._pending_balances = balance_data
+            return
+        fingerprint = hash(tuple(
+            (ex, tuple(sorted((a, round(v, 4) if isinstance(v, (int, float)) else v) for a, v in d.items())))
+            for ex, d in sorted(balance_data.items())
+        ))
+        if fingerprint == self._last_balance_fp:
+            return
+        self._last_balance_fp = fingerprint
+        struct_hash = hash(frozenset((ex, frozenset(assets)) for ex, assets in balance_data.items()))
+        if struct_hash == self._balance_struct_hash:
+            # Same exchanges and assets as last tick: only the values move.
+            self._refresh_balance_values(balance_data)
+            return
+        self._balance_struct_hash = struct_hash
+
+        ex_key = frozenset(balance_data)
+        if ex_key != self._ex_cache_key:
+            self._ex_cache_key = ex_key
+            self._sorted_exchanges = sorted(ex_key)
+        all_assets = frozenset().union(*balance_data.values())
+        if all_assets != self._asset_cache_key:
+            self._asset_cache_key = all_assets
+            self._sorted_assets = sorted(all_assets)
+        exchange_names = self._sorted_exchanges
+        sorted_assets = self._sorted_assets
+        if exchange_names == self._balance_exchanges and sorted_assets == self._balance_assets:
+            self._refresh_balance_values(balance_data)
+            return
+
+        # Release only the rows/columns that disappeared; everything else is kept.
+        exchange_set = set(exchange_names)
+        for ex_name in [ex for ex in self._balance_headers if ex not in exchange_set]:
+            self._release_balance_label(self._balance_headers.pop(ex_name))
+        for asset in [a for a in self._balance_asset_labels if a not in all_assets]:
+            self._release_balance_label(self._balance_asset_labels.pop(asset))
+        for key in [k for k in self._balance_cells if k[0] not in all_assets or k[1] not in exchange_set]:
+            self._release_balance_label(self._balance_cells.pop(key))
+            self._balance_cell_text.pop(key, None)
+
+        # Tk already coalesces geometry work into one idle pass, so the cost here is
+        # the number of grid/columnconfigure calls; only issue the ones that change.
         num_cols = len(exchange_names) + 1
-        for i in range(num_cols):
-            self.balance_frame.grid_columnconfigure(i, weight=1)
+        if num_cols != self._balance_num_cols:
+            for i in range(num_cols, self._balance_num_cols):
+                self.balance_frame.grid_columnconfigure(i, weight=0)
+            for i in range(self._balance_num_cols, num_cols):
+                self.balance_frame.grid_columnconfigure(i, weight=1)
+            self._balance_num_cols = num_cols
+
+        if self._balance_corner is None:
+            self._balance_corner = self._acquire_balance_label("", self._font_bold)
+            self._balance_corner.grid(row=0, column=0)
 
-        ctk.CTkLabel(self.balance_frame, text="").grid(row=0, column=0)
         for col_idx, ex_name in enumerate(exchange_names, 1):
-            header = ctk.CTkLabel(
-                self.balance_frame,
-                text=ex_name.capitalize(),
-                font=ctk.CTkFont(weight="bold"),
-            )
-            header.grid(row=0, column=col_idx, padx=5, pady=2, sticky="ew")
+            header = self._balance_headers.get(ex_name)
+            if header is None:
+                header = self._balance_headers[ex_name] = self._acquire_balance_label(ex_name.capitalize(), self._font_bold)
+            self._place_balance_label(header, 0, col_idx, "ew")
 
         for row_idx, asset in enumerate(sorted_assets, 1):
-            asset_label = ctk.CTkLabel(
-                self.balance_frame,
-                text=asset,
-                font=ctk.CTkFont(weight="bold"),
-                anchor="w",
-            )
-            asset_label.grid(row=row_idx, column=0, padx=5, pady=2, sticky="w")
+            asset_label = self._balance_asset_labels.get(asset)
+            if asset_label is None:
+                asset_label = self._balance_asset_labels[asset] = self._acquire_balance_label(asset, self._font_bold, anchor="w")
+            self._place_balance_label(asset_label, row_idx, 0, "w")
             for col_idx, ex_name in enumerate(exchange_names, 1):
-                balance = balance_data.get(ex_name, {}).get(asset, 0.0)
-                val = balance if isinstance(balance, (int, float)) else 0.0
-                ctk.CTkLabel(
-                    self.balance_frame,
-                    text=f"{val:.4f}",
-                    font=ctk.CTkFont(size=11),
-                    anchor="e",
-                ).grid(row=row_idx, column=col_idx, padx=5, pady=2, sticky="ew")
+                key = (asset, ex_name)
+                cell = self._balance_cells.get(key)
+                if cell is None:
+                    cell = self._balance_cells[key] = self._acquire_balance_label("", self._font_small, anchor="e")
+                    self._balance_cell_text[key] = ""
+                self._place_balance_label(cell, row_idx, col_idx, "ew")
+
+        self._balance_exchanges = exchange_names
+        self._balance_assets = sorted_assets
+        self._refresh_balance_values(balance_data)
 
     def update_runtime_clock(self, uptime_seconds: int):
         """Updates runtime timer display."""
-        hours, remainder = divmod(uptime_seconds, 3600)
-        minutes, seconds = divmod(remainder, 60)
-        self.runtime_label.configure(text=f"{hours:02}:{minutes:02}:{seconds:02}")
+        if uptime_seconds == self._last_uptime_seconds:
+            return
+        self._last_uptime_seconds = uptime_seconds
+        self._runtime_text = _fmt_hms(uptime_seconds)
+        self._set_text("runtime", self._runtime_text)
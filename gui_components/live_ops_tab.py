@@ -1,27 +1,151 @@
 #live_ops_tab.py
 
 import customtkinter as ctk
+import logging
+import tkinter as tk
+from array import array
+from collections import deque
+from contextlib import contextmanager
+from functools import lru_cache
 from typing import Any, Dict, Optional
 import time
 
 from bot_engine import ArbitrageBot
 
+
+_LOG_FONT = ("Courier New", 12)
+_HISTORY_FONT = ("Calibri", 12)
+# Indexed by cmp(new, old) + 1: down, unchanged, up.
+_ARROWS = (" ▼", "", " ▲")
+_NAN = float("nan")
+# Indexed by bool: spread_pct > 0, is_profitable.
+_SPREAD_COLORS = ("red", "green")
+_HIGHLIGHTS = ("transparent", "#1E4D2B")
+
+
+@lru_cache(maxsize=4096)
+def _fmt_price(value: float) -> str:
+    return f"{value:.4f}"
+
+
+@lru_cache(maxsize=1024)
+def _fmt_spread(value: float) -> str:
+    return f"{value:.3f}%"
+
+
+@lru_cache(maxsize=1)
+def _clock_hms(epoch_second: int) -> str:
+    # Bursts within the same second reuse the last strftime result.
+    return time.strftime('%H:%M:%S', time.localtime(epoch_second))
+
+
+class MarketRowRenderer:
+    """
+    Price-tick state for the market scan grid, owned by the refresh worker thread.
+    The layout (symbols, bid/ask columns) is fixed at construction and the Tk thread never
+    mutates an instance: LiveOpsTab builds a new renderer whenever it lays out the grid.
+    """
+
+    def __init__(self, symbols: tuple, bidask_keys: tuple, default_text_color, tick_colors: tuple):
+        self._bidask_keys = bidask_keys
+        self._default_text_color = default_text_color
+        self._tick_colors = tick_colors
+        width = len(bidask_keys)
+        # Last price per (symbol row, bid/ask column), flattened; NaN means "unset".
+        self._price_offset: Dict[str, int] = {symbol: i * width for i, symbol in enumerate(symbols)}
+        self.last_prices = array("d", [_NAN]) * (width * len(symbols))
+
+    def prerender(self, data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Turns a raw market row into ready-to-apply cell texts/colors and the row highlight.
+        Makes no Tk calls. Returns None for symbols that have no row in the scan grid.
+        """
+        symbol = data.get('symbol')
+        offset = self._price_offset.get(symbol)
+        if offset is None:
+            return None
+        # Hot loop: bind attributes and globals to locals once.
+        last_prices = self.last_prices
+        tick_colors = self._tick_colors
+        arrows = _ARROWS
+        fmt_price = _fmt_price
+        data_get = data.get
+
+        # --- BID/ASK PRICES WITH INDICATORS ---
+        cells = []
+        append = cells.append
+        for col, (ex_name, price_type, label_key) in enumerate(self._bidask_keys, offset):
+            new_price = data_get(label_key)
+            if new_price is None:
+                append((label_key, "-", "gray"))
+                continue
+            # Comparisons against the NaN sentinel are False, so an unset price ticks "unchanged".
+            old_price = last_prices[col]
+            tick = (new_price > old_price) - (new_price < old_price) + 1
+            append((label_key, fmt_price(new_price) + arrows[tick], tick_colors[tick]))
+            last_prices[col] = new_price
+
+        # --- SPREAD ---
+        spread_pct = data.get('spread_pct')
+        if spread_pct is not None:
+            cells.append(('spread', _fmt_spread(spread_pct), _SPREAD_COLORS[spread_pct > 0]))
+        else:
+            cells.append(('spread', "-", self._default_text_color))
+
+        return {"symbol": symbol, "cells": cells, "highlight": _HIGHLIGHTS[bool(data.get('is_profitable'))]}
+
+
 class LiveOpsTab(ctk.CTkFrame):
     """
     The "Live Operations" tab.
     Contains the live market scan, recent opportunity history, and the main log output.
     """
-    def __init__(self, master, config: Dict[str, Any], bot: Optional[ArbitrageBot]):
+    SCAN_CELL_WIDTH = 90
+    # Both textboxes are bounded to these many lines so long sessions stay cheap;
+    # the opportunity history re-renders from its ring buffer at most every 100 ms.
+    MAX_LOG_LINES = 5000
+    MAX_OPP_HISTORY_LINES = 200
+    OPP_HISTORY_FLUSH_MS = 100
+    LOG_FLUSH_MS = 50
+    # Market rows are flushed at most this often (~20 Hz), latest snapshot per symbol.
+    # Under load the interval stretches so a flush costs at most 1/MARKET_FLUSH_BUDGET
+    # of the Tk thread, based on an EWMA of recent flush times.
+    MARKET_FLUSH_MS = 50
+    MARKET_FLUSH_BUDGET = 4
+    MARKET_FLUSH_EWMA_ALPHA = 0.2
+
+    def __init__(self, master, config: Dict[str, Any], bot: Optional[ArbitrageBot], logger: Optional[logging.Logger] = None):
         super().__init__(master, fg_color="transparent")
         self.config = config
         self.bot = bot
+        self.logger = logger or logging.getLogger(__name__)
         self.market_data_labels: Dict[str, Dict[str, ctk.CTkLabel]] = {}
+        self.market_row_frames: Dict[str, ctk.CTkFrame] = {}
         
-        # --- NEW: Store the last price to detect changes ---
-        self.last_prices: Dict[str, Any] = {}
+        # Replaced (never mutated) on each grid layout; the refresh worker prerenders through it.
+        self.market_renderer: Optional[MarketRowRenderer] = None
+        # Last configure() kwargs applied per scan widget (cells and row frames).
+        self._applied: Dict[Any, tuple] = {}
+        self._staged_cfg: Optional[Dict[Any, Dict[str, Any]]] = None
+        self._pending_market: Dict[str, Dict[str, Any]] = {}
+        self._flush_scheduled = False
+        self._flush_cost_ms = 0.0
+        self._clients: tuple = ()
+        self._log_lines = 0
+        # Messages not yet written to log_textbox; flushed in one batch every LOG_FLUSH_MS.
+        self._log_buffer: deque = deque(maxlen=self.MAX_LOG_LINES)
+        self._log_flush_scheduled = False
+        self._opp_history: deque = deque(maxlen=self.MAX_OPP_HISTORY_LINES)
+        self._opp_dirty = False
+        self._bidask_keys: tuple = ()
+        self._symbols: tuple = ()
+        self._row_widgets: Dict[str, tuple] = {}
         self.default_text_color = ctk.ThemeManager.theme["CTkLabel"]["text_color"]
         self.price_up_color = "#33FF99"   # A brighter green
         self.price_down_color = "#FF6666" # A softer red
+        self._tick_colors = (self.price_down_color, self.default_text_color, self.price_up_color)
+
+        self._font_bold = ctk.CTkFont(weight="bold")
 
         self.grid_rowconfigure(2, weight=1)
         self.grid_columnconfigure(0, weight=1)
@@ -29,7 +153,7 @@ class LiveOpsTab(ctk.CTkFrame):
         self.build_market_scan_panel()
         self.build_opportunity_history_panel()
         
-        self.log_textbox = ctk.CTkTextbox(self, state="disabled", font=("Courier New", 12))
+        self.log_textbox = ctk.CTkTextbox(self, state="disabled", font=_LOG_FONT)
         self.log_textbox.grid(row=2, column=0, sticky="nsew", padx=10, pady=10)
         self.setup_log_colors()
         self.pack(expand=True, fill="both")
@@ -39,51 +163,75 @@ class LiveOpsTab(ctk.CTkFrame):
         scan_outer_frame = ctk.CTkFrame(self)
         scan_outer_frame.grid(row=0, column=0, sticky="ew", padx=10, pady=10)
         scan_outer_frame.grid_columnconfigure(0, weight=1)
-        ctk.CTkLabel(scan_outer_frame, text="Live Market Scan", font=ctk.CTkFont(weight="bold")).pack()
+        ctk.CTkLabel(scan_outer_frame, text="Live Market Scan", font=self._font_bold).pack()
         
         scan_frame = ctk.CTkScrollableFrame(scan_outer_frame, height=200)
         scan_frame.pack(fill="x", expand=True, padx=5, pady=5)
         
         if not self.bot: return
 
-        clients = self.bot.exchange_manager.get_all_clients()
-        headers = ["Symbol"] + [f"{name.capitalize()} {val}" for name in clients for val in ["Bid", "Ask"]] + ["Spread %"]
-        scan_frame.grid_columnconfigure(list(range(len(headers))), weight=1)
-        
+        # Layout is fixed once built; precompute what the per-update path iterates.
+        self._clients = tuple(self.bot.exchange_manager.get_all_clients())
+        self._bidask_keys = tuple(
+            (ex_name, price_type, f"{ex_name}_{price_type}")
+            for ex_name in self._clients for price_type in ("bid", "ask")
+        )
+        self._symbols = tuple(self.config['trading_parameters']['symbols_to_scan'])
+        headers = (
+            ("Symbol",)
+            + tuple(f"{ex_name.capitalize()} {price_type.capitalize()}" for ex_name, price_type, _ in self._bidask_keys)
+            + ("Spread %",)
+        )
+        scan_frame.grid_columnconfigure(0, weight=1)
+
+        # Header and every symbol row live in their own frame with identical,
+        # uniform columns, so a row highlight is one configure on the row frame.
+        header_frame = self._make_scan_row(scan_frame, 0, len(headers))
         for i, header in enumerate(headers):
-            ctk.CTkLabel(scan_frame, text=header, font=ctk.CTkFont(weight="bold")).grid(row=0, column=i, padx=5)
+            ctk.CTkLabel(header_frame, text=header, font=self._font_bold, width=self.SCAN_CELL_WIDTH).grid(row=0, column=i, padx=5)
         
-        for i, symbol in enumerate(self.config['trading_parameters']['symbols_to_scan']):
-            row_index = i + 1
+        for i, symbol in enumerate(self._symbols):
+            row_frame = self._make_scan_row(scan_frame, i + 1, len(headers))
+            self.market_row_frames[symbol] = row_frame
             self.market_data_labels[symbol] = {}
-            self.last_prices[symbol] = {} # Initialize storage for this symbol
             
-            symbol_label = ctk.CTkLabel(scan_frame, text=symbol, fg_color="transparent")
-            symbol_label.grid(row=row_index, column=0, padx=5, pady=2, sticky="ew")
+            symbol_label = ctk.CTkLabel(row_frame, text=symbol, fg_color="transparent", width=self.SCAN_CELL_WIDTH)
+            symbol_label.grid(row=0, column=0, padx=5, pady=2, sticky="ew")
             self.market_data_labels[symbol]['symbol'] = symbol_label
             
-            col_idx = 1
-            for ex_name in clients:
-                for val in ["bid", "ask"]:
-                    label_key = f"{ex_name}_{val}"
-                    label = ctk.CTkLabel(scan_frame, text="-", fg_color="transparent")
-                    label.grid(row=row_index, column=col_idx, padx=5, pady=2, sticky="ew")
-                    self.market_data_labels[symbol][label_key] = label
-                    self.last_prices[symbol][label_key] = None # Initialize last price
-                    col_idx += 1
-
-            spread_label = ctk.CTkLabel(scan_frame, text="-", fg_color="transparent")
-            spread_label.grid(row=row_index, column=col_idx, padx=5, pady=2, sticky="ew")
+            for col_idx, (_, _, label_key) in enumerate(self._bidask_keys, start=1):
+                label = ctk.CTkLabel(row_frame, text="-", fg_color="transparent", width=self.SCAN_CELL_WIDTH)
+                label.grid(row=0, column=col_idx, padx=5, pady=2, sticky="ew")
+                self.market_data_labels[symbol][label_key] = label
+
+            spread_label = ctk.CTkLabel(row_frame, text="-", fg_color="transparent", width=self.SCAN_CELL_WIDTH)
+            spread_label.grid(row=0, column=len(headers) - 1, padx=5, pady=2, sticky="ew")
             self.market_data_labels[symbol]['spread'] = spread_label
+            # Same order as MarketRowRenderer.prerender's cells: bid/ask per exchange, then spread.
+            self._row_widgets[symbol] = tuple(
+                self.market_data_labels[symbol][label_key] for _, _, label_key in self._bidask_keys
+            ) + (spread_label,)
+
+        # Published in one assignment; a worker mid-refresh keeps using the renderer it already holds.
+        self.market_renderer = MarketRowRenderer(
+            self._symbols, self._bidask_keys, self.default_text_color, self._tick_colors
+        )
+
+    def _make_scan_row(self, scan_frame, row_index: int, num_cols: int) -> ctk.CTkFrame:
+        row_frame = ctk.CTkFrame(scan_frame, fg_color="transparent", corner_radius=0)
+        row_frame.grid(row=row_index, column=0, sticky="ew")
+        row_frame.grid_columnconfigure(list(range(num_cols)), weight=1, uniform="scan")
+        return row_frame
 
     def build_opportunity_history_panel(self):
         """Creates the textbox for recent profitable opportunities."""
         opp_history_frame = ctk.CTkFrame(self)
         opp_history_frame.grid(row=1, column=0, sticky="ew", padx=10, pady=10)
-        ctk.CTkLabel(opp_history_frame, text="Recent Profitable Opportunities", font=ctk.CTkFont(weight="bold")).pack(pady=(5,5))
-        self.opp_history_textbox = ctk.CTkTextbox(opp_history_frame, state="disabled", height=120, font=("Calibri", 12))
+        ctk.CTkLabel(opp_history_frame, text="Recent Profitable Opportunities", font=self._font_bold).pack(pady=(5,5))
+        self.opp_history_textbox = ctk.CTkTextbox(opp_history_frame, state="disabled", height=120, font=_HISTORY_FONT)
         self.opp_history_textbox.pack(fill="x", expand=True, padx=5, pady=5)
         self.opp_history_textbox.tag_config("profit", foreground="cyan")
+        self.after(self.OPP_HISTORY_FLUSH_MS, self._flush_opp_history)
 
     def setup_log_colors(self):
         """Configures color tags for the main log textbox."""
@@ -95,9 +243,26 @@ class LiveOpsTab(ctk.CTkFrame):
         self.log_textbox.tag_config("SUCCESS", foreground="green")
 
     def add_log_message(self, level: str, message: str):
-        """Adds a new line to the log textbox with appropriate color."""
+        """Buffers a log line; bursts are written to the textbox in one batch."""
+        self._log_buffer.append((f"{message}\n", level))
+        if not self._log_flush_scheduled:
+            self._log_flush_scheduled = True
+            self.after(self.LOG_FLUSH_MS, self._flush_log)
+
+    def _flush_log(self):
+        """Appends all buffered lines with their color tags and trims the textbox to MAX_LOG_LINES."""
+        self._log_flush_scheduled = False
+        entries, self._log_buffer = self._log_buffer, deque(maxlen=self.MAX_LOG_LINES)
+        if not entries:
+            return
         self.log_textbox.configure(state="normal")
-        self.log_textbox.insert("end", f"{message}\n", level)
+        for text, level in entries:
+            self.log_textbox.insert("end", text, level)
+            self._log_lines += text.count("\n")
+        if self._log_lines > self.MAX_LOG_LINES:
+            excess = self._log_lines - self.MAX_LOG_LINES
+            self.log_textbox.delete("1.0", f"{excess + 1}.0")
+            self._log_lines = self.MAX_LOG_LINES
         self.log_textbox.configure(state="disabled")
         self.log_textbox.see("end")
 
@@ -105,74 +270,80 @@ class LiveOpsTab(ctk.CTkFrame):
         """Adds a new line to the opportunity history textbox."""
         symbol = data.get('symbol', 'N/A')
         spread = data.get('spread_pct', 0.0)
-        timestamp = time.strftime('%H:%M:%S')
-        log_line = f"[{timestamp}] {symbol:<10} | Spread: {spread:.3f}%\n"
-        self.opp_history_textbox.configure(state="normal")
-        self.opp_history_textbox.insert("1.0", log_line, "profit")
-        self.opp_history_textbox.configure(state="disabled")
-
-    def update_market_data_display(self, data: Dict[str, Any]):
-        """Updates a single row in the market scan grid with new data, including price change indicators."""
+        # Producers may stamp the line at emit time; otherwise stamp it here.
+        timestamp = data.get('ts_str') or _clock_hms(int(time.time()))
+        self._opp_history.appendleft(f"[{timestamp}] {symbol:<10} | Spread: {spread:.3f}%\n")
+        self._opp_dirty = True
+
+    def _flush_opp_history(self):
+        """Re-renders the (bounded, newest-first) history in one insert when it changed."""
+        if self._opp_dirty:
+            self._opp_dirty = False
+            self.opp_history_textbox.configure(state="normal")
+            self.opp_history_textbox.delete("1.0", "end")
+            self.opp_history_textbox.insert("1.0", "".join(self._opp_history), "profit")
+            self.opp_history_textbox.configure(state="disabled")
+        self.after(self.OPP_HISTORY_FLUSH_MS, self._flush_opp_history)
+
+    def update_market_data_display(self, row: Dict[str, Any]):
+        """Queues a pre-rendered market row; bursts are coalesced into one capped-rate repaint."""
         if not self.bot: return
+        self._pending_market[row['symbol']] = row
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            delay = max(self.MARKET_FLUSH_MS, int(self._flush_cost_ms * self.MARKET_FLUSH_BUDGET))
+            self.after(delay, self._flush_pending)
+
+    def _flush_pending(self):
+        """Renders only the latest queued snapshot for each symbol."""
+        self._flush_scheduled = False
+        pending, self._pending_market = self._pending_market, {}
+        started = time.perf_counter()
+        with self._batch_redraw():
+            for row in pending.values():
+                self._render_market(row)
+        cost_ms = (time.perf_counter() - started) * 1000.0
+        alpha = self.MARKET_FLUSH_EWMA_ALPHA
+        self._flush_cost_ms += alpha * (cost_ms - self._flush_cost_ms)
+
+    @contextmanager
+    def _batch_redraw(self):
+        """Collects configure() kwargs per widget and applies each widget once on exit."""
+        self._staged_cfg = {}
         try:
-            symbol = data.get('symbol')
-            if symbol in self.market_data_labels:
-                labels = self.market_data_labels[symbol]
-                last_symbol_prices = self.last_prices.get(symbol, {})
-                clients = self.bot.exchange_manager.get_all_clients()
-                
-                # --- UPDATE BID/ASK PRICES WITH INDICATORS ---
-                for ex_name in clients:
-                    for price_type in ["bid", "ask"]:
-                        label_key = f"{ex_name}_{price_type}"
-                        label_widget = labels.get(label_key)
-                        new_price = data.get(label_key)
-                        if new_price is None:
-                            label_widget.configure(text="-", text_color="gray")
-                            continue
-
-                        if label_widget and new_price is not None:
-                            old_price = last_symbol_prices.get(label_key)
-                            
-                            text_color = self.default_text_color
-                            indicator = ""
-                            
-                            if old_price is not None:
-                                if new_price > old_price:
-                                    text_color = self.price_up_color
-                                    indicator = " ▲"
-                                elif new_price < old_price:
-                                    text_color = self.price_down_color
-                                    indicator = " ▼"
-                            
-                            label_widget.configure(text=f"{new_price:.4f}{indicator}", text_color=text_color)
-                            self.last_prices[symbol][label_key] = new_price # Update stored price
-                        elif label_widget:
-                            label_widget.configure(text="-", text_color=self.default_text_color)
-
-
-                # --- UPDATE SPREAD ---
-                spread_pct = data.get('spread_pct')
-                is_profitable = data.get('is_profitable', False)
-                spread_label = labels['spread']
-                
-                if spread_pct is not None:
-                    spread_color = "green" if spread_pct > 0 else "red"
-                    spread_label.configure(text=f"{spread_pct:.3f}%", text_color=spread_color)
-                else:
-                    spread_label.configure(text="-", text_color=self.default_text_color)
-
-                # --- UPDATE ROW HIGHLIGHT ---
-                highlight_color = "#1E4D2B" if is_profitable else "transparent" 
-                for label_widget in labels.values():
-                   label_widget.configure(fg_color=highlight_color)
-
-        except Exception as e:
-            # Using master's logger to log the error. The widget hierarchy is master.master.master
-            # LiveOpsTab -> CTkFrame(tab) -> CTkTabview -> CTkFrame(right_frame) -> App
-            # This is a bit fragile; a more robust solution might involve passing the logger down.
-            try:
-                self.master.master.master.master.logger.warning(f"Failed to update GUI market data. Error: {e}", exc_info=False)
-            except AttributeError: # Fallback if widget hierarchy changes
-                print(f"GUI ERROR: Failed to log market data update error: {e}")
+            yield
+        finally:
+            staged, self._staged_cfg = self._staged_cfg, None
+            for widget, kwargs in staged.items():
+                try:
+                    widget.configure(**kwargs)
+                except tk.TclError as e:
+                    self.logger.warning("Failed to update GUI market data. Error: %s", e)
+
+    def _configure(self, widget, **kwargs):
+        """
+        configure() that is skipped when the widget already shows exactly these
+        values, and otherwise merged into the open redraw batch, if any.
+        """
+        applied = tuple(kwargs.items())
+        if self._applied.get(widget) == applied:
+            return
+        self._applied[widget] = applied
+        if self._staged_cfg is None:
+            widget.configure(**kwargs)
+        else:
+            self._staged_cfg.setdefault(widget, {}).update(kwargs)
+
+    def _render_market(self, row: Dict[str, Any]):
+        """Applies a pre-rendered row (see MarketRowRenderer.prerender) to the market scan grid."""
+        symbol = row['symbol']
+
+        # _configure skips every cell whose text/color is unchanged.
+        configure = self._configure
+        for widget, (_, text, text_color) in zip(self._row_widgets[symbol], row['cells']):
+            configure(widget, text=text, text_color=text_color)
+
+        # Cells are transparent children of the row frame, so the highlight
+        # is a single configure on the row, applied only when it flips.
+        configure(self.market_row_frames[symbol], fg_color=row['highlight'])
 
@@ -1,10 +1,8 @@
 # main.py
 
 import os
-import sys
 import logging
 from logging.handlers import RotatingFileHandler
-import customtkinter as ctk
 from tkinter import messagebox
 from dotenv import load_dotenv
 
@@ -12,6 +10,35 @@ import config.logging_config as logging_config # <-- IMPORT THE NEW FILE
 from core.utils import load_config, ConfigError
 from gui_components.gui_application import App
 
+_DOTENV_LOADED = False
+
+# ccxt credential field -> env var suffix after "<EXCHANGE>_TESTNET_", per active exchange.
+EXCHANGE_CREDENTIALS = {
+    'okx': {"apiKey": "API_KEY", "secret": "SECRET", "password": "PASSPHRASE"},
+    'binance': {"apiKey": "API_KEY", "secret": "SECRET"},
+    'bybit': {"apiKey": "API_KEY", "secret": "SECRET"},
+}
+
+def load_env():
+    """Loads .env into os.environ once per process and returns a snapshot of it."""
+    global _DOTENV_LOADED
+    if not _DOTENV_LOADED:
+        load_dotenv()
+        _DOTENV_LOADED = True
+    return os.environ.copy()
+
+def collect_exchange_credentials(env):
+    """Builds the EXCHANGES dict from one pass over env, keyed by the <EXCHANGE>_TESTNET_ prefix."""
+    by_exchange = {}
+    for key, value in env.items():
+        exchange, sep, suffix = key.partition("_TESTNET_")
+        if sep:
+            by_exchange.setdefault(exchange.lower(), {})[suffix] = value
+    return {
+        ex: {field: by_exchange.get(ex, {}).get(suffix) for field, suffix in fields.items()}
+        for ex, fields in EXCHANGE_CREDENTIALS.items()
+    }
+
 def setup_simple_logging():
     """Configures a simple rotating file logger and a console logger."""
     logging_config.setup_custom_log_levels() # <-- SETUP CUSTOM LEVELS
@@ -35,26 +62,12 @@ def setup_simple_logging():
     logging.info("Simplified logging configured.")
 
 if __name__ == "__main__":
-    load_dotenv()
+    env = load_env()
     try:
         logging_config.setup_logging()
         config = load_config()
         
-        EXCHANGES = {
-            'okx': {
-                "apiKey": os.getenv("OKX_TESTNET_API_KEY"), 
-                "secret": os.getenv("OKX_TESTNET_SECRET"), 
-                "password": os.getenv("OKX_TESTNET_PASSPHRASE")
-            },
-            'binance': {
-                "apiKey": os.getenv("BINANCE_TESTNET_API_KEY"), 
-                "secret": os.getenv("BINANCE_TESTNET_SECRET")
-            },
-            'bybit':{
-                "apiKey": os.getenv("BYBIT_TESTNET_API_KEY"), 
-                "secret": os.getenv("BYBIT_TESTNET_SECRET")
-            }
-        }
+        EXCHANGES = collect_exchange_credentials(env)
 
         all_keys_present = all(val for ex_config in EXCHANGES.values() for val in ex_config.values())
         if not all_keys_present:
@@ -0,0 +1,112 @@
+import logging
+from types import SimpleNamespace
+
+import ccxt
+import pytest
+
+# Marking the root logger configured keeps test runs from truncating logs/bot.log.
+logging.getLogger()._is_configured = True
+
+from core.trade_executor import TradeExecutor
+
+
+class FakeExchange:
+    """ccxt-shaped client; each create_order takes the next scripted outcome (default: filled)."""
+
+    def __init__(self, exchange_id, *outcomes):
+        self.id = exchange_id
+        self.has = {"fetchOrder": True, "cancelOrder": True}
+        self.markets = {}
+        self.created = []
+        self.canceled = []
+        self._orders = {}
+        self._outcomes = list(outcomes)
+
+    def create_order(self, symbol, otype, side, amount, price, params):
+        outcome = self._outcomes.pop(0) if self._outcomes else {"status": "closed"}
+        if isinstance(outcome, Exception):
+            raise outcome
+        order_id = f"{self.id}-{len(self.created) + 1}"
+        self.created.append((side, otype, amount))
+        self._orders[order_id] = dict({"filled": amount}, **outcome, id=order_id)
+        return {"id": order_id}
+
+    def fetch_order(self, order_id, symbol):
+        return dict(self._orders[order_id])
+
+    def cancel_order(self, order_id, symbol):
+        order = self._orders[order_id]
+        if order["status"] != "open":
+            raise ccxt.ExchangeError(f"order {order_id} is {order['status']}")
+        self.canceled.append(order_id)
+        order["status"] = "canceled"
+
+
+def _run(buy_ex, sell_ex):
+    manager = SimpleNamespace(clients={buy_ex.id: buy_ex, sell_ex.id: sell_ex}, cached_balances={})
+    executor = TradeExecutor(manager)
+    executor.set_runtime_params(min_poll_s=0.05, max_poll_s=0.05)
+    opportunity = SimpleNamespace(
+        symbol="BTC/USDT", amount=1.0, buy_exchange=buy_ex.id, sell_exchange=sell_ex.id,
+        buy_price=100.0, sell_price=101.0, order_monitor_timeout_s=0.2,
+    )
+    try:
+        return executor.execute_and_monitor_opportunity(opportunity)
+    finally:
+        executor.close()
+
+
+def test_both_legs_filled():
+    buy_ex, sell_ex = FakeExchange("a"), FakeExchange("b")
+    result = _run(buy_ex, sell_ex)
+    assert result["status"] == "filled"
+    assert buy_ex.created == [("buy", "market", 1.0)]
+    assert sell_ex.created == [("sell", "market", 1.0)]
+
+
+def test_one_leg_filled_is_unwound():
+    buy_ex = FakeExchange("a")
+    sell_ex = FakeExchange("b", {"status": "canceled", "filled": 0.0})
+    result = _run(buy_ex, sell_ex)
+    assert result["status"] == "neutralized"
+    assert result["kind"] == "unfilled"
+    assert buy_ex.created == [("buy", "market", 1.0), ("sell", "market", 1.0)]
+    assert sell_ex.created == [("sell", "market", 1.0)]
+
+
+def test_partial_fill_is_unwound():
+    buy_ex = FakeExchange("a")
+    sell_ex = FakeExchange("b", {"status": "canceled", "filled": 0.4})
+    result = _run(buy_ex, sell_ex)
+    assert result["status"] == "neutralized"
+    assert buy_ex.created[-1] == ("sell", "market", 1.0)
+    assert sell_ex.created[-1] == ("buy", "market", 0.4)
+
+
+def test_timed_out_leg_is_cancelled_and_its_fill_unwound():
+    buy_ex = FakeExchange("a")
+    sell_ex = FakeExchange("b", {"status": "open", "filled": 0.3})
+    result = _run(buy_ex, sell_ex)
+    assert sell_ex.canceled == ["b-1"]
+    assert result["leg2"]["status"] == "canceled"
+    assert result["leg2"]["filled"] == pytest.approx(0.3)
+    assert result["status"] == "neutralized"
+    assert buy_ex.created[-1] == ("sell", "market", 1.0)
+    assert sell_ex.created[-1] == ("buy", "market", 0.3)
+
+
+def test_failed_hedge_is_critical():
+    buy_ex = FakeExchange("a", {"status": "closed"}, ccxt.ExchangeError("market closed"))
+    sell_ex = FakeExchange("b", {"status": "rejected", "filled": 0.0})
+    result = _run(buy_ex, sell_ex)
+    assert result["status"] == "critical"
+    assert result["unwind"][0]["status"] == "failed"
+
+
+def test_leg_exception_still_unwinds_the_filled_leg():
+    buy_ex = FakeExchange("a")
+    sell_ex = FakeExchange("b", ccxt.InsufficientFunds("no BTC"))
+    result = _run(buy_ex, sell_ex)
+    assert result["status"] == "neutralized"
+    assert result["kind"] == "insufficient_funds"
+    assert buy_ex.created[-1] == ("sell", "market", 1.0)
@@ -0,0 +1,84 @@
+import csv
+import json
+import threading
+import time
+
+import pytest
+
+from data_models import TradeLogData
+from trade_logger import TradeLogger
+
+
+@pytest.fixture
+def trade_logger(tmp_path, monkeypatch):
+    # Log files are relative to the working directory.
+    monkeypatch.chdir(tmp_path)
+    logger = TradeLogger(mirror_jsonl=True)
+    yield logger
+    logger.close()
+
+
+def _read_csv(path):
+    with open(path, newline='') as f:
+        return list(csv.DictReader(f))
+
+
+def test_trade_rows_match_header(trade_logger):
+    trade = TradeLogData("s1", 1700000000, "BTC/USDT", "binance", "kraken, inc", 100.0, 101.0,
+                         0.5, 0.42, "filled", latency_ms=12)
+    trade_logger.log_trade(trade)
+    trade_logger.close()
+
+    [row] = _read_csv(TradeLogger.TRADE_LOG_FILE)
+    assert row["sell_exchange"] == "kraken, inc"
+    assert row["latency_ms"] == "12"
+    assert row["status"] == "filled"
+    with open(TradeLogger.TRADE_JSONL_FILE) as f:
+        assert json.loads(f.readline())["net_profit_usd"] == 0.42
+
+
+def test_scan_batch_shares_timestamp_and_skips_incomplete_quotes(trade_logger):
+    trade_logger.log_scan_batch({
+        "BTC/USDT": {"binance": {"bid": 1.0, "ask": 2.0}, "kraken": {"bid": None, "ask": 2.5}},
+        "ETH/USDT": {"binance": {"bid": 3.0, "ask": 4.0}},
+    }, timestamp=1700000000)
+    trade_logger.close()
+
+    rows = _read_csv(TradeLogger.SCAN_LOG_FILE)
+    assert [(r["symbol"], r["exchange"]) for r in rows] == [("BTC/USDT", "binance"), ("ETH/USDT", "binance")]
+    assert {r["timestamp"] for r in rows} == {"1700000000"}
+
+
+def test_buffered_scan_rows_are_flushed_without_further_calls(trade_logger):
+    trade_logger.log_scan_data("BTC/USDT", {"binance": {"bid": 1.0, "ask": 2.0}}, timestamp=1)
+    assert _read_csv(TradeLogger.SCAN_LOG_FILE) == []
+
+    time.sleep(TradeLogger.SCAN_FLUSH_INTERVAL_S * 2)
+    assert len(_read_csv(TradeLogger.SCAN_LOG_FILE)) == 1
+
+
+def test_concurrent_scan_batches_stay_in_order(trade_logger, monkeypatch):
+    monkeypatch.setattr(trade_logger, "SCAN_FLUSH_ROWS", 7)
+
+    def writer(tag):
+        for i in range(300):
+            trade_logger.log_scan_data("BTC/USDT", {tag: {"bid": i, "ask": i}}, timestamp=i)
+
+    threads = [threading.Thread(target=writer, args=(f"ex{n}",)) for n in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    trade_logger.close()
+
+    rows = _read_csv(TradeLogger.SCAN_LOG_FILE)
+    assert len(rows) == 1200
+    for n in range(4):
+        seq = [int(r["bid"]) for r in rows if r["exchange"] == f"ex{n}"]
+        assert seq == list(range(300))
+
+
+def test_close_is_idempotent(trade_logger):
+    trade_logger.close()
+    trade_logger.close()
+    assert not trade_logger._flusher.is_alive()
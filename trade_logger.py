@@ -1,31 +1,76 @@
 # trade_logger.py
 
+import atexit
 import csv
+import json
 import os
 import time
-from threading import Lock
-from typing import Any, Dict, List
+from functools import lru_cache
+from threading import Event, Lock, Thread, current_thread
+from typing import Any, Dict, List, Optional
 
-from data_models import TradeLogData
+from data_models import TRADE_LOG_COLUMNS, TradeLogData
+
+try:  # C-accelerated JSON for the trades.jsonl mirror, when installed
+    import orjson
+
+    def _json_line(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+except ImportError:
+    def _json_line(obj) -> bytes:
+        return (json.dumps(obj, separators=(',', ':')) + '\n').encode()
+
+@lru_cache(maxsize=256)
+def _csv_escape(value: str) -> str:
+    """Quotes a field the way csv.writer would (symbols/exchanges repeat, so this is cached)."""
+    if any(c in value for c in ',"\r\n'):
+        return '"' + value.replace('"', '""') + '"'
+    return value
+
+def _csv_cell(value: Any) -> Any:
+    if value is None:
+        return ''
+    if isinstance(value, str):
+        return _csv_escape(value)
+    return value
+
+def _row_template(header) -> str:
+    # csv.writer's default line terminator, so appended rows match the header line.
+    return ','.join('{%s}' % col for col in header) + '\r\n'
 
 class TradeLogger:
     """Handles writing trade and scan data to CSV files in a thread-safe manner."""
     TRADE_LOG_FILE = 'trades.csv'
+    TRADE_JSONL_FILE = 'trades.jsonl'
     SCAN_LOG_FILE = 'scans.csv'
     
-    TRADE_LOG_HEADER = [
-        'session_id', 'timestamp', 'symbol', 'buy_exchange', 'sell_exchange', 'buy_price', 
-        'sell_price', 'amount', 'net_profit_usd', 'running_profit_usd', 
-        'latency_ms', 'fees_paid', 'fill_ratio', 'status'
-    ]
+    TRADE_LOG_HEADER = TRADE_LOG_COLUMNS
     # --- NEW, DETAILED SCAN HEADER ---
-    SCAN_LOG_HEADER = [
+    SCAN_LOG_HEADER = (
         'timestamp', 'symbol', 'exchange', 'bid', 'ask'
-    ]
+    )
+    # Scan rows are buffered and appended in one write once SCAN_FLUSH_ROWS are pending;
+    # a background flusher writes whatever is left every SCAN_FLUSH_INTERVAL_S.
+    SCAN_FLUSH_ROWS = 500
+    SCAN_FLUSH_INTERVAL_S = 1.0
 
-    def __init__(self):
+    def __init__(self, mirror_jsonl: bool = False):
+        """mirror_jsonl: also append every trade to trades.jsonl (one JSON object per line)."""
         self._lock = Lock()
+        self._scan_buffer: List[Dict[str, Any]] = []
+        # Rows are rendered with fixed format strings instead of csv.DictWriter.
+        # Trades are positional: TradeLogData.to_row() yields values in header order.
+        self._trade_fmt = ','.join(['{}'] * len(self.TRADE_LOG_HEADER)) + '\r\n'
+        self._scan_fmt = _row_template(self.SCAN_LOG_HEADER)
         self._initialize_files()
+        # Append handles stay open for the logger's lifetime instead of open/write/close per call.
+        self._trade_fp = open(self.TRADE_LOG_FILE, 'ab', buffering=1 << 16)
+        self._scan_fp = open(self.SCAN_LOG_FILE, 'ab', buffering=1 << 16)
+        self._trade_fp_jsonl = open(self.TRADE_JSONL_FILE, 'ab', buffering=1 << 16) if mirror_jsonl else None
+        self._flush_stop = Event()
+        self._flusher = Thread(target=self._flush_loop, name="scan-flusher", daemon=True)
+        self._flusher.start()
+        atexit.register(self.close)
 
     def _initialize_files(self):
         """Create CSV files with headers if they don't exist."""
@@ -42,28 +87,92 @@ class TradeLogger:
     def log_trade(self, log_data: TradeLogData):
         """Appends a single trade record to the trades CSV file."""
         with self._lock:
-            with open(self.TRADE_LOG_FILE, 'a', newline='') as f:
-                writer = csv.DictWriter(f, fieldnames=self.TRADE_LOG_HEADER)
-                writer.writerow(log_data.to_dict())
+            self._trade_fp.write(self._trade_fmt.format(*map(_csv_cell, log_data.to_row())).encode())
+            # Trades are rare and must be durable: flush every record.
+            self._trade_fp.flush()
+            if self._trade_fp_jsonl is not None:
+                self._write_trade_jsonl(log_data)
 
-    def log_scan_data(self, symbol: str, prices: Dict[str, Any]):
+    def log_trade_jsonl(self, log_data: TradeLogData):
+        """Appends a single trade record to trades.jsonl only."""
+        with self._lock:
+            if self._trade_fp_jsonl is None:
+                self._trade_fp_jsonl = open(self.TRADE_JSONL_FILE, 'ab', buffering=1 << 16)
+            self._write_trade_jsonl(log_data)
+
+    def _write_trade_jsonl(self, log_data: TradeLogData):
+        self._trade_fp_jsonl.write(_json_line(log_data.to_dict()))
+        self._trade_fp_jsonl.flush()
+
+    def log_scan_data(self, symbol: str, prices: Dict[str, Any], timestamp: Optional[int] = None):
         """
         Appends multiple rows for a single market scan, one for each exchange.
+        Pass the scan's timestamp (epoch seconds) so every symbol logged in one scan shares it.
         """
-        timestamp = int(time.time())
+        if timestamp is None:
+            timestamp = time.time_ns() // 1_000_000_000
         rows_to_write = []
+        self._collect_scan_rows(symbol, prices, timestamp, rows_to_write)
+        self._buffer_scan_rows(rows_to_write)
+
+    def log_scan_batch(self, scans: Dict[str, Dict[str, Dict[str, float]]], timestamp: Optional[int] = None):
+        """
+        Logs a whole scan tick ({symbol: {exchange: {'bid', 'ask'}}}) with one shared
+        timestamp and a single lock acquisition, instead of one log_scan_data call per symbol.
+        """
+        if timestamp is None:
+            timestamp = time.time_ns() // 1_000_000_000
+        rows_to_write = []
+        for symbol, prices in scans.items():
+            self._collect_scan_rows(symbol, prices, timestamp, rows_to_write)
+        self._buffer_scan_rows(rows_to_write)
+
+    @staticmethod
+    def _collect_scan_rows(symbol: str, prices: Dict[str, Any], timestamp: int, out: List[Dict[str, Any]]):
         for exchange, data in prices.items():
             if data.get('bid') is not None and data.get('ask') is not None:
-                rows_to_write.append({
+                out.append({
                     'timestamp': timestamp,
-                    'symbol': symbol,
-                    'exchange': exchange,
+                    'symbol': _csv_escape(symbol),
+                    'exchange': _csv_escape(exchange),
                     'bid': data['bid'],
                     'ask': data['ask']
                 })
-        
-        if rows_to_write:
-            with self._lock:
-                with open(self.SCAN_LOG_FILE, 'a', newline='') as f:
-                    writer = csv.DictWriter(f, fieldnames=self.SCAN_LOG_HEADER)
-                    writer.writerows(rows_to_write)
\ No newline at end of file
+
+    def _buffer_scan_rows(self, rows_to_write: List[Dict[str, Any]]):
+        """Buffers rows, writing the buffer inline once SCAN_FLUSH_ROWS are pending."""
+        if not rows_to_write:
+            return
+        with self._lock:
+            self._scan_buffer.extend(rows_to_write)
+            if len(self._scan_buffer) >= self.SCAN_FLUSH_ROWS:
+                self._write_scan_rows()
+
+    def _flush_loop(self):
+        # Bounds how long a buffered row waits when scanning slows down or stops.
+        while not self._flush_stop.wait(self.SCAN_FLUSH_INTERVAL_S):
+            self.flush()
+
+    def flush(self):
+        """Writes any buffered scan rows (run by the flusher thread; safe to call any time)."""
+        with self._lock:
+            if self._scan_buffer and not self._scan_fp.closed:
+                self._write_scan_rows()
+
+    def close(self):
+        """Stops the flusher, writes buffered scan rows and closes the file handles (registered with atexit)."""
+        self._flush_stop.set()
+        if self._flusher is not current_thread():
+            self._flusher.join()
+        self.flush()
+        with self._lock:
+            for fp in (self._trade_fp, self._scan_fp, self._trade_fp_jsonl):
+                if fp is not None and not fp.closed:
+                    fp.close()
+
+    def _write_scan_rows(self):
+        # Caller holds _lock, so batches reach scans.csv in the order they were buffered.
+        batch, self._scan_buffer = self._scan_buffer, []
+        fmt = self._scan_fmt.format_map
+        self._scan_fp.write(''.join(fmt(r) for r in batch).encode())
+        self._scan_fp.flush()
\ No newline at end of file